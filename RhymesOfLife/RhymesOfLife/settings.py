@@ -82,6 +82,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "base.middleware.viewer_context.ViewerContextMiddleware",
     "base.middleware.user_language.SetUserLanguageMiddleware",
     "base.middleware.enforce_onboarding.EnforceOnboardingMiddleware",
     "base.middleware.banned_users.BannedUserMiddleware",
@@ -231,6 +232,7 @@ POSTBOX_REGION = environment.get("POSTBOX_REGION", "ru-central1")
 POSTBOX_ENDPOINT = environment.get("POSTBOX_ENDPOINT", "https://postbox.cloud.yandex.net")
 POSTBOX_FROM_EMAIL = environment.get("POSTBOX_FROM_EMAIL", DEFAULT_FROM_EMAIL)
 EMAIL_PROVIDER = environment.get("EMAIL_PROVIDER", "postbox_api")
+POSTBOX_SEND_WORKERS = int(environment.get("POSTBOX_SEND_WORKERS", 8))
 
 
 
@@ -285,6 +287,37 @@ else:
 TELEGRAM_BOT_TOKEN_USERS = env_value("TELEGRAM_BOT_TOKEN_USERS", "")
 TELEGRAM_BOT_USERNAME = env_value("TELEGRAM_BOT_USERNAME", "")
 TELEGRAM_PROXY_URL = env_value("TELEGRAM_PROXY_URL", "")
+TELEGRAM_GLOBAL_RATE = float(env_value("TELEGRAM_GLOBAL_RATE", 30))
+TELEGRAM_CHAT_RATE = float(env_value("TELEGRAM_CHAT_RATE", 1))
+TELEGRAM_GROUP_RATE_PER_MINUTE = float(env_value("TELEGRAM_GROUP_RATE_PER_MINUTE", 20))
+TELEGRAM_SEND_WORKERS = int(env_value("TELEGRAM_SEND_WORKERS", 8))
+
+REDIS_HOST = env_value("REDIS_HOST", "redis")
+REDIS_PORT = int(env_value("REDIS_PORT", 6379))
+
+if env_value("CACHE_BACKEND", "locmem") == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/1",
+        }
+    }
+
+COUNTER_WRITE_BEHIND = str(env_value("COUNTER_WRITE_BEHIND", False)).lower() in ("1", "true", "yes")
+COUNTER_FLUSH_INTERVAL_SECONDS = int(env_value("COUNTER_FLUSH_INTERVAL_SECONDS", 5))
+
+BLOG_PAGE_CACHE_SECONDS = int(env_value("BLOG_PAGE_CACHE_SECONDS", 600))
+
+RENDITION_WORKERS = int(env_value("RENDITION_WORKERS", 2))
+RENDITION_POLL_INTERVAL_SECONDS = int(env_value("RENDITION_POLL_INTERVAL_SECONDS", 3))
+
+OUTBOX_BATCH_SIZE = int(env_value("OUTBOX_BATCH_SIZE", 100))
+OUTBOX_MAX_ATTEMPTS = int(env_value("OUTBOX_MAX_ATTEMPTS", 8))
+OUTBOX_RETRY_BASE_SECONDS = int(env_value("OUTBOX_RETRY_BASE_SECONDS", 30))
+OUTBOX_POLL_INTERVAL_SECONDS = int(env_value("OUTBOX_POLL_INTERVAL_SECONDS", 2))
+
+TIMELINE_FAN_OUT_BATCH_SIZE = int(env_value("TIMELINE_FAN_OUT_BATCH_SIZE", 20))
+TIMELINE_POLL_INTERVAL_SECONDS = int(env_value("TIMELINE_POLL_INTERVAL_SECONDS", 2))
 
 
 SECURE_PROXY_SSL_HEADER = tuple(environment.get("SECURE_PROXY_SSL_HEADER", ())) or None
@@ -9,6 +9,8 @@ from .models import (
     MedicalDocument,
     MedicalExam,
     Notification,
+    NotificationOutbox,
+    BroadcastJob,
     Follower,
     ExamComment,
     PhoneVerification,
@@ -22,6 +24,7 @@ from .models import (
     Post, PostImage, PostLike, PostComment, PostReport,
     PatientAccessRequest,
 )
+from .utils import notification_cache, timeline
 
 
 class SoftDeleteAdminMixin:
@@ -165,15 +168,49 @@ class NotificationAdmin(SoftDeleteAdminMixin, JSONFieldAdminMixin, admin.ModelAd
 
     @admin.action(description=_("Mark as read"))
     def mark_as_read(self, request, queryset):
+        recipient_ids = list(queryset.values_list("recipient_id", flat=True).distinct())
         n = queryset.update(is_read=True)
+        notification_cache.invalidate(recipient_ids)
         self.message_user(request, _("%(n)d notifications marked as read.") % {"n": n}, messages.SUCCESS)
 
     @admin.action(description=_("Mark as unread"))
     def mark_as_unread(self, request, queryset):
+        recipient_ids = list(queryset.values_list("recipient_id", flat=True).distinct())
         n = queryset.update(is_read=False)
+        notification_cache.invalidate(recipient_ids)
         self.message_user(request, _("%(n)d notifications marked as unread.") % {"n": n}, messages.SUCCESS)
 
 
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(JSONFieldAdminMixin, admin.ModelAdmin):
+    actions = ("retry_now",)
+    list_display = ("id", "channel", "status", "recipient", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("channel", "status", "created_at")
+    search_fields = ("recipient__user__username", "dedupe_key", "last_error")
+    raw_id_fields = ("recipient", "notification")
+    readonly_fields = ("created_at", "updated_at", "sent_at")
+    date_hierarchy = "created_at"
+    list_select_related = ("recipient__user",)
+    list_per_page = 50
+
+    @admin.action(description=_("Retry now"))
+    def retry_now(self, request, queryset):
+        n = queryset.exclude(status=NotificationOutbox.Status.SENT).update(
+            status=NotificationOutbox.Status.PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, _("%(n)d messages queued for retry.") % {"n": n}, messages.SUCCESS)
+
+
+@admin.register(BroadcastJob)
+class BroadcastJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "notification_type", "status", "processed_count", "total_count", "attempts", "created_at")
+    list_filter = ("status", "notification_type", "created_at")
+    search_fields = ("title", "message", "sender__user__username")
+    raw_id_fields = ("sender",)
+    readonly_fields = ("created_at", "updated_at", "finished_at")
+    list_select_related = ("sender__user",)
+
+
 @admin.register(Follower)
 class FollowerAdmin(admin.ModelAdmin):
     list_display = ("id", "follower", "following", "is_active", "created_at")
@@ -308,21 +345,32 @@ class PostAdmin(admin.ModelAdmin):
     list_select_related = ("author__user", "approved_by")
     list_per_page = 50
 
+    @staticmethod
+    def _after_moderation(ids):
+        Post.bump_content_version(ids)
+        timeline.schedule_sync(ids)
+
     @admin.action(description=_("Approve selected"))
     def approve_selected(self, request, queryset):
-        n = queryset.filter(is_approved=False).update(
+        ids = list(queryset.filter(is_approved=False).values_list("pk", flat=True))
+        n = Post.objects.filter(pk__in=ids).update(
             is_approved=True, approved_at=timezone.now(), approved_by=request.user
         )
+        self._after_moderation(ids)
         self.message_user(request, _("%(n)d posts approved.") % {"n": n}, messages.SUCCESS)
 
     @admin.action(description=_("Hide selected"))
     def hide_selected(self, request, queryset):
-        n = queryset.filter(is_hidden=False).update(is_hidden=True)
+        ids = list(queryset.filter(is_hidden=False).values_list("pk", flat=True))
+        n = Post.objects.filter(pk__in=ids).update(is_hidden=True)
+        self._after_moderation(ids)
         self.message_user(request, _("%(n)d posts hidden.") % {"n": n}, messages.SUCCESS)
 
     @admin.action(description=_("Unhide selected"))
     def unhide_selected(self, request, queryset):
-        n = queryset.filter(is_hidden=True).update(is_hidden=False)
+        ids = list(queryset.filter(is_hidden=True).values_list("pk", flat=True))
+        n = Post.objects.filter(pk__in=ids).update(is_hidden=False)
+        self._after_moderation(ids)
         self.message_user(request, _("%(n)d posts unhidden.") % {"n": n}, messages.SUCCESS)
 
 
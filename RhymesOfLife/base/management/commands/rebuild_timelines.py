@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from ...models import AdditionalUserInfo
+from ...utils.timeline import rebuild_timeline
+
+
+class Command(BaseCommand):
+    help = "Rebuild materialized subscription timelines from active follow relations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="Rebuild only the timeline of this auth user id.")
+
+    def handle(self, *args, **options):
+        qs = AdditionalUserInfo.objects.filter(following__is_active=True).distinct()
+        if options.get("user_id"):
+            qs = qs.filter(user_id=options["user_id"])
+
+        owners = 0
+        entries = 0
+        for info in qs.iterator(chunk_size=500):
+            entries += rebuild_timeline(info)
+            owners += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {owners} timelines ({entries} entries)."))
@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.models import ArticleComment, ArticleLike, BlogPage
+
+from ...models import Post, PostComment, PostLike
+
+
+def _count_subquery(model, fk: str, **filters):
+    return Coalesce(
+        Subquery(
+            model.objects.filter(**{fk: OuterRef("pk")}, **filters)
+            .order_by()
+            .values(fk)
+            .annotate(c=Count("*"))
+            .values("c")[:1]
+        ),
+        0,
+    )
+
+
+TARGETS = {
+    "posts": (
+        Post,
+        {
+            "likes_count": (PostLike, "post", {"is_active": True}),
+            "comments_count": (PostComment, "post", {"is_deleted": False}),
+        },
+    ),
+    "articles": (
+        BlogPage,
+        {
+            "likes_count": (ArticleLike, "article", {"is_active": True}),
+            "comments_count": (ArticleComment, "article", {"is_deleted": False}),
+        },
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = "Recompute drifted likes_count/comments_count on posts and articles in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--only", choices=sorted(TARGETS), help="Reconcile only posts or only articles.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true", help="Report drifted rows without updating them.")
+
+    def handle(self, *args, **options):
+        names = [options["only"]] if options.get("only") else sorted(TARGETS)
+        chunk = max(1, options["chunk_size"])
+
+        for name in names:
+            model, fields = TARGETS[name]
+            actual = {
+                field: _count_subquery(rel_model, fk, **filters)
+                for field, (rel_model, fk, filters) in fields.items()
+            }
+            drift = Q()
+            for field in fields:
+                drift |= ~Q(**{field: F(f"actual_{field}")})
+
+            drifted_ids = list(
+                model.objects
+                .annotate(**{f"actual_{field}": expr for field, expr in actual.items()})
+                .filter(drift)
+                .order_by()
+                .values_list("pk", flat=True)
+            )
+            if options["dry_run"]:
+                self.stdout.write(f"{name}: {len(drifted_ids)} drifted rows")
+                continue
+
+            for i in range(0, len(drifted_ids), chunk):
+                model.objects.filter(pk__in=drifted_ids[i:i + chunk]).update(**actual)
+
+            self.stdout.write(self.style.SUCCESS(f"{name}: reconciled {len(drifted_ids)} rows"))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Post, PostComment
+from ...utils.html import SANITIZER_VERSION, render_comment_html, render_post_html
+
+TARGETS = {
+    "posts": (Post, render_post_html),
+    "comments": (PostComment, render_comment_html),
+}
+
+
+class Command(BaseCommand):
+    help = "Re-render stored post/comment HTML whose sanitizer version is out of date."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--only", choices=sorted(TARGETS), help="Process only posts or only comments.")
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--force", action="store_true", help="Re-render every row, not only stale ones.")
+
+    def handle(self, *args, **options):
+        names = [options["only"]] if options.get("only") else sorted(TARGETS)
+        chunk = max(1, options["chunk_size"])
+
+        for name in names:
+            model, render = TARGETS[name]
+            qs = model.objects.order_by("pk")
+            if not options["force"]:
+                qs = qs.exclude(text_html_version=SANITIZER_VERSION)
+                if not qs.exists():
+                    self.stdout.write(f"{name}: up to date (sanitizer v{SANITIZER_VERSION})")
+                    continue
+
+            done = 0
+            last_pk = 0
+            while True:
+                rows = list(qs.filter(pk__gt=last_pk).only("pk", "text")[:chunk])
+                if not rows:
+                    break
+                for row in rows:
+                    row.text_html = render(row.text)
+                    row.text_html_version = SANITIZER_VERSION
+                model.objects.bulk_update(rows, ["text_html", "text_html_version"])
+                last_pk = rows[-1].pk
+                done += len(rows)
+
+            self.stdout.write(self.style.SUCCESS(f"{name}: re-rendered {done} rows"))
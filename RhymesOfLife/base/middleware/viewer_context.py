@@ -0,0 +1,10 @@
+from base.utils.viewer import ViewerContext
+
+
+class ViewerContextMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.viewer = ViewerContext(request)
+        return self.get_response(request)
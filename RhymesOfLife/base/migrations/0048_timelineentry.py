@@ -0,0 +1,44 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BACKFILL_SQL = """
+INSERT INTO base_timelineentry (owner_id, post_id, created_at)
+SELECT owner_id, post_id, created_at FROM (
+    SELECT f.follower_id AS owner_id, p.id AS post_id, p.created_at,
+           row_number() OVER (PARTITION BY f.follower_id ORDER BY p.created_at DESC, p.id DESC) AS rn
+    FROM base_follower f
+    JOIN base_post p ON p.author_id = f.following_id
+    WHERE f.is_active AND p.is_approved AND NOT p.is_deleted AND NOT p.is_hidden AND NOT p.is_hidden_by_reports
+) ranked
+WHERE ranked.rn <= 500
+ON CONFLICT DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0047_post_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField()),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='base.additionaluserinfo')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='base.post')),
+            ],
+            options={
+                'verbose_name': 'Timeline entry',
+                'verbose_name_plural': 'Timeline entries',
+                'indexes': [models.Index(fields=['owner', '-created_at', '-post'], name='base_timeli_owner_i_2c196a_idx')],
+                'unique_together': {('owner', 'post')},
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
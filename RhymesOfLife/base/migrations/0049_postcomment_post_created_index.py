@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0048_timelineentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='postcomment',
+            index=models.Index(fields=['post', '-created_at', '-id'], name='base_postco_post_id_5065cb_idx'),
+        ),
+    ]
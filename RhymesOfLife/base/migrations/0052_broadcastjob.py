@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0051_post_content_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('FOLLOW', 'Follow'), ('EXAM_COMMENT', 'ExamComment'), ('RECOMMENDATION', 'Recommendation'), ('ADMIN_MESSAGE', 'AdminMessage'), ('SYSTEM_MESSAGE', 'SystemMessage'), ('ACCESS_REQUEST', 'AccessRequest'), ('ACCESS_GRANTED', 'AccessGranted'), ('ACCESS_DENIED', 'AccessDenied'), ('ARTICLE_PUBLISHED', 'ArticlePublished')], max_length=50)),
+                ('source', models.CharField(choices=[('user', 'User'), ('admin', 'Admin'), ('system', 'System')], default='admin', max_length=16)),
+                ('title', models.CharField(blank=True, max_length=140)),
+                ('message', models.TextField(blank=True)),
+                ('url', models.URLField(blank=True, max_length=500)),
+                ('button_text', models.CharField(blank=True, max_length=64)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=16)),
+                ('total_count', models.PositiveIntegerField(default=0)),
+                ('processed_count', models.PositiveIntegerField(default=0)),
+                ('telegram_sent_count', models.PositiveIntegerField(default=0)),
+                ('email_sent_count', models.PositiveIntegerField(default=0)),
+                ('last_recipient_id', models.BigIntegerField(default=0)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('sender', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='broadcast_jobs', to='base.additionaluserinfo')),
+            ],
+        ),
+    ]
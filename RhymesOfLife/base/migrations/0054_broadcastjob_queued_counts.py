@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0053_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='broadcastjob',
+            old_name='telegram_sent_count',
+            new_name='telegram_queued_count',
+        ),
+        migrations.RenameField(
+            model_name='broadcastjob',
+            old_name='email_sent_count',
+            new_name='email_queued_count',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0055_notificationoutbox_optional_recipient'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CounterFlushBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_id', models.CharField(max_length=64, unique=True)),
+                ('applied_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
@@ -8,10 +8,13 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import gettext as _g
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator, MaxLengthValidator
-from django.db.models import Q, UniqueConstraint
+from django.db.models import F, Q, UniqueConstraint
+from django.utils.safestring import mark_safe
 
 import uuid
 
+from .utils.html import SANITIZER_VERSION, render_comment_html, render_post_html
+
 
 User = get_user_model()
 
@@ -444,6 +447,88 @@ class Notification(SoftDeleteModel):
         return f"{self.notification_type} [{self.source}/{self.scope}] {s} -> {r}"
 
 
+class NotificationOutbox(models.Model):
+    class Channel(models.TextChoices):
+        TELEGRAM = "telegram", "Telegram"
+        EMAIL = "email", "Email"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    notification = models.ForeignKey(
+        Notification, related_name="outbox", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    recipient = models.ForeignKey(
+        AdditionalUserInfo, related_name="outbox_messages", on_delete=models.CASCADE, null=True, blank=True
+    )
+    channel = models.CharField(max_length=16, choices=Channel.choices)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    payload = models.JSONField(default=dict, blank=True)
+    dedupe_key = models.CharField(max_length=200, null=True, blank=True, unique=True)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                name="outbox_pending_idx",
+                condition=Q(status="pending"),
+            ),
+            models.Index(fields=["recipient", "-created_at"]),
+        ]
+
+    def __str__(self):
+        target = _safe_username(self.recipient) if self.recipient_id else (self.payload or {}).get("chat_id")
+        return f"Outbox#{self.pk} {self.channel} {self.status} -> {target}"
+
+
+class CounterFlushBatch(models.Model):
+    batch_id = models.CharField(max_length=64, unique=True)
+    applied_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"CounterFlush {self.batch_id}"
+
+
+class BroadcastJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    sender = models.ForeignKey(
+        AdditionalUserInfo, related_name="broadcast_jobs", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    notification_type = models.CharField(max_length=50, choices=Notification.NOTIFICATION_TYPES)
+    source = models.CharField(max_length=16, choices=Notification.Source.choices, default=Notification.Source.ADMIN)
+    title = models.CharField(max_length=140, blank=True)
+    message = models.TextField(blank=True)
+    url = models.URLField(max_length=500, blank=True)
+    button_text = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING, db_index=True)
+    total_count = models.PositiveIntegerField(default=0)
+    processed_count = models.PositiveIntegerField(default=0)
+    telegram_queued_count = models.PositiveIntegerField(default=0)
+    email_queued_count = models.PositiveIntegerField(default=0)
+    last_recipient_id = models.BigIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"BroadcastJob#{self.pk} {self.notification_type} {self.status} {self.processed_count}/{self.total_count}"
+
+
 class Follower(models.Model):
     follower = models.ForeignKey("AdditionalUserInfo", related_name="following", on_delete=models.CASCADE)
     following = models.ForeignKey("AdditionalUserInfo", related_name="followers", on_delete=models.CASCADE)
@@ -548,6 +633,16 @@ def post_upload_to(instance, filename):
     return f"posts/{instance.post_id}/{filename}"
 
 
+def _render_text_html(obj, render, save_kwargs) -> None:
+    update_fields = save_kwargs.get("update_fields")
+    if update_fields is not None and "text" not in update_fields:
+        return
+    obj.text_html = render(obj.text)
+    obj.text_html_version = SANITIZER_VERSION
+    if update_fields is not None:
+        save_kwargs["update_fields"] = {*update_fields, "text_html", "text_html_version"}
+
+
 class Post(models.Model):
     author = models.ForeignKey(
         AdditionalUserInfo,
@@ -556,6 +651,9 @@ class Post(models.Model):
         verbose_name=_("Author"),
     )
     text = models.TextField(_("Text"), blank=True)
+    text_html = models.TextField(blank=True, default="", editable=False)
+    text_html_version = models.PositiveSmallIntegerField(default=0, editable=False)
+    content_version = models.PositiveIntegerField(default=1, editable=False)
     is_hidden = models.BooleanField(_("Hidden by author"), default=False, db_index=True)
     is_deleted = models.BooleanField(_("Soft-deleted"), default=False, db_index=True)
 
@@ -573,15 +671,45 @@ class Post(models.Model):
 
     is_hidden_by_reports = models.BooleanField(_("Hidden by reports"), default=False, db_index=True)
     reports_count = models.PositiveIntegerField(_("Reports count"), default=0)
+    timeline_pending = models.BooleanField(default=False, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(fields=["author", "-created_at", "-id"]),
+            models.Index(fields=["id"], name="post_timeline_pending_idx", condition=Q(timeline_pending=True)),
+        ]
         verbose_name = _("Post")
         verbose_name_plural = _("Posts")
 
     def __str__(self):
         return f"Post#{self.pk} by {_safe_username(self.author)}"
 
+    CONTENT_FIELDS = frozenset({"text", "is_approved", "is_hidden", "is_deleted", "is_hidden_by_reports"})
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        bump = bool(self.pk) and (update_fields is None or bool(self.CONTENT_FIELDS.intersection(update_fields)))
+        if bump:
+            self.content_version = F("content_version") + 1
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "content_version"}
+        _render_text_html(self, render_post_html, kwargs)
+        super().save(*args, **kwargs)
+        if bump:
+            self.refresh_from_db(fields=["content_version"])
+
+    @classmethod
+    def bump_content_version(cls, ids) -> int:
+        return cls.objects.filter(pk__in=list(ids)).update(content_version=F("content_version") + 1)
+
+    @property
+    def rendered_text(self):
+        if self.text_html_version == SANITIZER_VERSION:
+            return mark_safe(self.text_html)
+        return mark_safe(render_post_html(self.text))
+
     @property
     def visible_comments(self):
         return self.comments.filter(is_deleted=False)
@@ -629,18 +757,50 @@ class PostComment(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="comments")
     author = models.ForeignKey(AdditionalUserInfo, on_delete=models.CASCADE)
     text = models.TextField(_("Text"))
+    text_html = models.TextField(blank=True, default="", editable=False)
+    text_html_version = models.PositiveSmallIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
     edited_at = models.DateTimeField(_("Edited at"), null=True, blank=True)
     is_deleted = models.BooleanField(_("Soft-deleted"), default=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["post", "-created_at", "-id"]),
+        ]
         verbose_name = _("Post comment")
         verbose_name_plural = _("Post comments")
 
     def __str__(self):
         return _g("🗑 Deleted comment") if self.is_deleted else f"💬 {_safe_username(self.author)}: {self.text[:30]}"
 
+    def save(self, *args, **kwargs):
+        _render_text_html(self, render_comment_html, kwargs)
+        super().save(*args, **kwargs)
+
+    @property
+    def rendered_text(self):
+        if self.text_html_version == SANITIZER_VERSION:
+            return mark_safe(self.text_html)
+        return mark_safe(render_comment_html(self.text))
+
+
+class TimelineEntry(models.Model):
+    owner = models.ForeignKey(AdditionalUserInfo, on_delete=models.CASCADE, related_name="timeline_entries")
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="timeline_entries")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ("owner", "post")
+        indexes = [
+            models.Index(fields=["owner", "-created_at", "-post"]),
+        ]
+        verbose_name = _("Timeline entry")
+        verbose_name_plural = _("Timeline entries")
+
+    def __str__(self):
+        return f"{_safe_username(self.owner)} ← Post#{self.post_id}"
+
 
 class HelpRequest(models.Model):
     class Status(models.TextChoices):
@@ -1,13 +1,13 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext as _
 from .models import MedicalDocument
-from .utils.telegram import send_message
 
-from .models import Notification
-from .utils.telegram_user import send_message_to_userinfo
+from .models import Notification, Post, PostImage
+from .utils.notify import enqueue_staff_telegram, enqueue_user_telegram
+from .utils import notification_cache, timeline
 from .utils.logging import get_app_logger
 
 User = get_user_model()
@@ -35,7 +35,10 @@ def notify_admin_on_user_created(sender, instance: User, created: bool, **kwargs
     ]
     if admin_link:
         lines.append(f"{_('Admin')}: {admin_link}")
-    send_message("\n".join(lines))
+    try:
+        enqueue_staff_telegram("\n".join(lines))
+    except Exception:
+        log.exception("Failed to queue staff Telegram message: user_id=%s", instance.pk)
 
 
 @receiver(post_save, sender=MedicalDocument, dispatch_uid="notify_admin_on_document_created")
@@ -55,7 +58,10 @@ def notify_admin_on_document_created(sender, instance: MedicalDocument, created:
     ]
     if admin_link:
         lines.append(f"{_('Admin')}: {admin_link}")
-    send_message("\n".join(lines))
+    try:
+        enqueue_staff_telegram("\n".join(lines))
+    except Exception:
+        log.exception("Failed to queue staff Telegram message: document_id=%s", instance.pk)
 
 
 @receiver(post_save, sender=Notification)
@@ -67,6 +73,35 @@ def notify_user_in_telegram(sender, instance: Notification, created, **kwargs):
             payload = getattr(instance, "payload", None) or {}
             if isinstance(payload, dict) and payload.get("skip_telegram"):
                 return
-            send_message_to_userinfo(instance.message or "", instance.recipient)
+            enqueue_user_telegram(instance.recipient, instance.message or "", notification=instance)
     except Exception:
-        log.exception("Failed to push Telegram notification: id=%s", instance.id)
+        log.exception("Failed to queue Telegram notification: id=%s", instance.id)
+
+
+@receiver(post_save, sender=Post, dispatch_uid="sync_post_timelines")
+def sync_post_timelines(sender, instance: Post, created: bool, update_fields=None, **kwargs):
+    if update_fields is not None and not timeline.VISIBILITY_FIELDS.intersection(update_fields):
+        return
+    try:
+        timeline.schedule_sync([instance.id])
+    except Exception:
+        log.exception("Failed to schedule post timeline sync: post_id=%s", instance.id)
+
+
+@receiver(post_save, sender=PostImage, dispatch_uid="bump_post_content_on_image_save")
+@receiver(post_delete, sender=PostImage, dispatch_uid="bump_post_content_on_image_delete")
+def bump_post_content_on_image_change(sender, instance: PostImage, **kwargs):
+    Post.bump_content_version([instance.post_id])
+
+
+@receiver(post_save, sender=Notification, dispatch_uid="refresh_notification_cache")
+def refresh_notification_cache(sender, instance: Notification, created: bool, **kwargs):
+    if created:
+        notification_cache.on_created(instance)
+    else:
+        notification_cache.invalidate([instance.recipient_id])
+
+
+@receiver(post_delete, sender=Notification, dispatch_uid="drop_notification_cache")
+def drop_notification_cache(sender, instance: Notification, **kwargs):
+    notification_cache.invalidate([instance.recipient_id])
@@ -4,7 +4,7 @@ from urllib.parse import urlsplit, urlunsplit
 import os
 
 from wagtail.models import Locale as WagtailLocale
-from blog.models import BlogIndexPage
+from blog.blog_index import get_blog_index
 
 register = template.Library()
 
@@ -48,7 +48,7 @@ def lang_path(context, lang_code):
 @register.simple_tag(takes_context=True)
 def blog_index_url(context):
     request = context.get("request")
-    page = BlogIndexPage.objects.first()
+    page = get_blog_index()
     if not page:
         return "/"
     try:
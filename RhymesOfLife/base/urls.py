@@ -69,7 +69,7 @@ from .views.public_profile_views import (
 )
 
 from .views.admin_notifications import (
-    admin_notify_page, admin_notify_api,
+    admin_notify_page, admin_notify_api, admin_broadcast_status,
     admin_user_suggest,
 )
 
@@ -187,6 +187,7 @@ urlpatterns = [
 
     path("staff/notify/", admin_notify_page, name="admin_notify"),
     path("staff/notify/api/", admin_notify_api, name="admin_notify_api"),
+    path("staff/notify/broadcasts/<int:job_id>/", admin_broadcast_status, name="admin_broadcast_status"),
     path("staff/notify/user-suggest/", admin_user_suggest, name="admin_user_suggest"),
 
     # path("help/request/", help_request_view, name="help_request"),
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from django.templatetags.static import static
+
+DEFAULT_AVATAR = "images/default-avatar.png"
+
+
+def stored_avatar_url(info) -> str:
+    avatar = getattr(info, "avatar", None)
+    if avatar and getattr(avatar, "name", ""):
+        try:
+            return avatar.url
+        except ValueError:
+            pass
+    return static(DEFAULT_AVATAR)
+
+
+def avatar_urls(infos) -> dict[int, str]:
+    return {info.pk: stored_avatar_url(info) for info in infos if info is not None}
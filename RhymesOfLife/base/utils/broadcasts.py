@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from base.models import AdditionalUserInfo, BroadcastJob, Notification
+
+from . import notification_cache
+from .logging import get_app_logger
+from .notify import enqueue_external_many
+
+log = get_app_logger(__name__)
+
+CHUNK_SIZE = int(getattr(settings, "BROADCAST_CHUNK_SIZE", 200))
+MAX_ATTEMPTS = 5
+ACTIVE_STATUSES = (BroadcastJob.Status.PENDING, BroadcastJob.Status.RUNNING)
+
+
+def _recipients():
+    return AdditionalUserInfo.objects.select_related("user", "telegram_account").order_by("id")
+
+
+def enqueue_broadcast(
+    *,
+    sender: AdditionalUserInfo | None,
+    notification_type: str,
+    title: str,
+    message: str,
+    url: str = "",
+    button_text: str = "",
+    source: str = Notification.Source.ADMIN,
+) -> BroadcastJob:
+    job = BroadcastJob.objects.create(
+        sender=sender,
+        notification_type=notification_type,
+        source=source,
+        title=title,
+        message=message,
+        url=url,
+        button_text=button_text,
+        total_count=AdditionalUserInfo.objects.count(),
+    )
+    log.info("Broadcast queued: job_id=%s total=%s", job.pk, job.total_count)
+    return job
+
+
+def _create_site_notifications(job: BroadcastJob, chunk) -> dict[int, Notification]:
+    already = set(
+        Notification.objects.filter(
+            recipient__in=chunk,
+            scope=Notification.Scope.BROADCAST,
+            payload__broadcast_id=job.pk,
+        ).values_list("recipient_id", flat=True)
+    )
+    rows = [
+        Notification(
+            recipient=info,
+            sender_id=job.sender_id,
+            notification_type=job.notification_type,
+            title=job.title,
+            message=job.message,
+            url=job.url,
+            payload={"broadcast_id": job.pk, "skip_telegram": True},
+            source=job.source,
+            scope=Notification.Scope.BROADCAST,
+        )
+        for info in chunk
+        if info.pk not in already
+    ]
+    Notification.objects.bulk_create(rows, batch_size=500)
+    notification_cache.invalidate(info.pk for info in chunk)
+    return {n.recipient_id: n for n in rows}
+
+
+def _delivery(job: BroadcastJob, info: AdditionalUserInfo, notification: Notification) -> dict:
+    return {
+        "recipient": info,
+        "notification": notification,
+        "title": job.title,
+        "message": job.message,
+        "url": job.url,
+        "button_text": job.button_text or None,
+        "dedupe_key": f"broadcast:{job.pk}:{info.pk}",
+    }
+
+
+def process_broadcast_chunk(job_id: int) -> bool:
+    with transaction.atomic():
+        job = (
+            BroadcastJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(pk=job_id, status__in=ACTIVE_STATUSES)
+            .first()
+        )
+        if job is None:
+            return False
+
+        chunk = list(_recipients().filter(id__gt=job.last_recipient_id)[:CHUNK_SIZE])
+        if not chunk:
+            job.status = BroadcastJob.Status.DONE
+            job.finished_at = timezone.now()
+            job.save(update_fields=["status", "finished_at", "updated_at"])
+            log.info("Broadcast done: job_id=%s processed=%s", job.pk, job.processed_count)
+            return False
+
+        created = _create_site_notifications(job, chunk)
+        queued = enqueue_external_many([
+            _delivery(job, info, created[info.pk]) for info in chunk if info.pk in created
+        ])
+
+        job.status = BroadcastJob.Status.RUNNING
+        job.last_recipient_id = chunk[-1].pk
+        job.processed_count += len(chunk)
+        job.telegram_queued_count += sum(1 for r in queued if r["telegram_queued"])
+        job.email_queued_count += sum(1 for r in queued if r["email_queued"])
+        job.save(update_fields=[
+            "status", "last_recipient_id", "processed_count",
+            "telegram_queued_count", "email_queued_count", "updated_at",
+        ])
+    return True
+
+
+def run_pending_broadcasts(*, logger=None) -> int:
+    logger = logger or log
+    job_ids = list(
+        BroadcastJob.objects
+        .filter(status__in=ACTIVE_STATUSES, attempts__lt=MAX_ATTEMPTS)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    for job_id in job_ids:
+        try:
+            while process_broadcast_chunk(job_id):
+                pass
+        except Exception as e:
+            BroadcastJob.objects.filter(pk=job_id).update(
+                attempts=F("attempts") + 1, last_error=str(e)[:2000], updated_at=timezone.now()
+            )
+            BroadcastJob.objects.filter(pk=job_id, attempts__gte=MAX_ATTEMPTS).update(
+                status=BroadcastJob.Status.FAILED, finished_at=timezone.now()
+            )
+            logger.exception("Broadcast job failed: job_id=%s", job_id)
+    return len(job_ids)
+
+
+def job_status(job: BroadcastJob) -> dict:
+    return {
+        "id": job.pk,
+        "status": job.status,
+        "total": job.total_count,
+        "processed": job.processed_count,
+        "telegram_queued": job.telegram_queued_count,
+        "email_queued": job.email_queued_count,
+        "finished": job.status in (BroadcastJob.Status.DONE, BroadcastJob.Status.FAILED),
+        "error": job.last_error if job.status == BroadcastJob.Status.FAILED else "",
+    }
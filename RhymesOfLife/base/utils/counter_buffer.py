@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from base.models import CounterFlushBatch
+
+from .counters import add_to_counter, apply_delta
+from .logging import get_app_logger
+from .redis_client import get_redis
+
+log = get_app_logger(__name__)
+
+PENDING_KEY = "counters:pending"
+FLUSHING_KEY = "counters:flushing"
+BATCH_KEY = "counters:flushing:batch"
+BATCH_RETENTION = timedelta(days=7)
+VALUES_KEY = "counters:values"
+VALUES_TTL_SECONDS = 60 * 60
+
+counters_flushed = Signal()
+
+
+def enabled() -> bool:
+    return bool(getattr(settings, "COUNTER_WRITE_BEHIND", False)) and get_redis() is not None
+
+
+def _field_key(model, pk: int, field: str) -> str:
+    return f"{model._meta.label_lower}:{pk}:{field}"
+
+
+def _parse_field_key(key: str):
+    label, pk, field = key.rsplit(":", 2)
+    return apps.get_model(label), int(pk), field
+
+
+def bump(model, pk: int, field: str, delta: int, *, current: int) -> int:
+    if not enabled():
+        return apply_delta(model, pk, field, delta)
+
+    key = _field_key(model, pk, field)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.hsetnx(VALUES_KEY, key, int(current or 0))
+        pipe.hincrby(VALUES_KEY, key, delta)
+        if delta:
+            pipe.hincrby(PENDING_KEY, key, delta)
+        pipe.expire(VALUES_KEY, VALUES_TTL_SECONDS)
+        value = pipe.execute()[1]
+        return max(int(value), 0)
+    except Exception:
+        log.exception("Counter buffer write failed, falling back to database: key=%s", key)
+        value = apply_delta(model, pk, field, delta)
+        counters_flushed.send_robust(sender=model, pks={pk})
+        return value
+
+
+def _batch_id(cli) -> str:
+    cli.set(BATCH_KEY, uuid.uuid4().hex, nx=True)
+    return cli.get(BATCH_KEY)
+
+
+def flush() -> int:
+    cli = get_redis()
+    if cli is None:
+        return 0
+
+    if not cli.exists(FLUSHING_KEY):
+        try:
+            cli.rename(PENDING_KEY, FLUSHING_KEY)
+        except Exception:
+            return 0
+        cli.delete(BATCH_KEY)
+
+    batch_id = _batch_id(cli)
+    pending = cli.hgetall(FLUSHING_KEY) or {}
+    applied = 0
+    flushed: dict = {}
+    with transaction.atomic():
+        _, created = CounterFlushBatch.objects.get_or_create(batch_id=batch_id)
+        if not created:
+            log.warning("Counter buffer batch already applied, dropping: batch=%s", batch_id)
+            pending = {}
+        for key, raw in pending.items():
+            delta = int(raw or 0)
+            if not delta:
+                continue
+            try:
+                model, pk, field = _parse_field_key(key)
+            except (LookupError, ValueError):
+                log.warning("Counter buffer skipped unknown key: %s", key)
+                continue
+            add_to_counter(model, pk, field, delta)
+            flushed.setdefault(model, set()).add(pk)
+            applied += 1
+        CounterFlushBatch.objects.filter(applied_at__lt=timezone.now() - BATCH_RETENTION).delete()
+    cli.delete(FLUSHING_KEY, BATCH_KEY)
+    if applied:
+        log.info("Counter buffer flushed: rows=%s batch=%s", applied, batch_id)
+    for model, pks in flushed.items():
+        counters_flushed.send_robust(sender=model, pks=pks)
+    return applied
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+
+def add_to_counter(model, pk: int, field: str, delta: int) -> int:
+    if not delta:
+        return 0
+    return model.objects.filter(pk=pk).update(**{field: Greatest(F(field) + delta, 0)})
+
+
+def apply_delta(model, pk: int, field: str, delta: int) -> int:
+    add_to_counter(model, pk, field, delta)
+    return model.objects.filter(pk=pk).values_list(field, flat=True).first() or 0
+
+
+def toggle_active(obj, field: str = "is_active") -> int:
+    current = getattr(obj, field)
+    updated = type(obj).objects.filter(pk=obj.pk, **{field: current}).update(**{field: not current})
+    if not updated:
+        obj.refresh_from_db(fields=[field])
+        return 0
+    setattr(obj, field, not current)
+    return 1 if not current else -1
+
+
+def mark_flag(obj, field: str, value: bool = True) -> bool:
+    updated = type(obj).objects.filter(pk=obj.pk).exclude(**{field: value}).update(**{field: value})
+    setattr(obj, field, value)
+    return bool(updated)
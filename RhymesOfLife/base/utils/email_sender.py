@@ -73,6 +73,14 @@ def _validate_payload(p: dict[str, Any]) -> None:
         raise ValueError("Email payload missing 'text' or 'html'")
 
 
+def _prepare_payload(payload: dict[str, Any], provider: str) -> dict[str, Any]:
+    p = _coerce_types(_normalize_payload(payload))
+    if provider == "postbox_api" and not p.get("from_email"):
+        p["from_email"] = getattr(settings, "POSTBOX_FROM_EMAIL", None)
+    _validate_payload(p)
+    return p
+
+
 def send_email(payload: dict[str, Any], *, logger: logging.Logger | None = None, provider: str | None = None) -> bool:
     logger = logger or log
     _ensure_project_root_on_path()
@@ -80,10 +88,7 @@ def send_email(payload: dict[str, Any], *, logger: logging.Logger | None = None,
     from RhymesOfLifeShadows.EmailVerificationSender import EmailVerificationSender  # noqa: E402
 
     prov = _get_provider(provider)
-    p = _coerce_types(_normalize_payload(payload))
-    if prov == "postbox_api" and not p.get("from_email"):
-        p["from_email"] = getattr(settings, "POSTBOX_FROM_EMAIL", None)
-    _validate_payload(p)
+    p = _prepare_payload(payload, prov)
 
     to_addr = p["to"]
     subject = p["subject"]
@@ -108,3 +113,37 @@ def send_email(payload: dict[str, Any], *, logger: logging.Logger | None = None,
     except Exception as exc:
         logger.exception("email.send.error provider=%s to=%s error=%s", prov, to_addr, exc)
         return False
+
+
+def send_emails(
+    payloads: list[dict[str, Any]], *, logger: logging.Logger | None = None, provider: str | None = None
+) -> list[bool]:
+    logger = logger or log
+    _ensure_project_root_on_path()
+
+    from RhymesOfLifeShadows.EmailVerificationSender import EmailVerificationSender  # noqa: E402
+
+    prov = _get_provider(provider)
+    results = [False] * len(payloads)
+    index, prepared = [], []
+    for i, payload in enumerate(payloads):
+        try:
+            prepared.append(_prepare_payload(payload, prov))
+            index.append(i)
+        except ValueError as exc:
+            logger.warning("email.send.invalid provider=%s to=%s error=%s", prov, (payload or {}).get("to"), exc)
+    if not prepared:
+        return results
+
+    try:
+        sent = EmailVerificationSender(provider=prov, logger=logger).send_emails(prepared)
+    except Exception as exc:
+        logger.exception("email.send.batch_error provider=%s count=%s error=%s", prov, len(prepared), exc)
+        return results
+
+    for i, ok in zip(index, sent):
+        results[i] = bool(ok)
+    logger.info(
+        "email.send.batch_done provider=%s sent=%s failed=%s", prov, sum(results), len(payloads) - sum(results)
+    )
+    return results
@@ -5,6 +5,8 @@ import re
 
 import bleach
 from bleach.css_sanitizer import CSSSanitizer
+from django.template.defaultfilters import linebreaksbr
+from django.utils.html import conditional_escape
 
 
 ALLOWED_TAGS = [
@@ -33,6 +35,12 @@ ALLOWED_CSS_PROPERTIES = [
 ]
 CSS_SANITIZER = CSSSanitizer(allowed_css_properties=ALLOWED_CSS_PROPERTIES)
 
+# Bump whenever the allow-lists above change so stored HTML gets re-rendered
+# by the resanitize_content command.
+SANITIZER_VERSION = 1
+
+HTML_TAG_RE = re.compile(r"</?[a-zA-Z][^>]*>")
+
 
 def sanitize_html(html: str) -> str:
     return bleach.clean(
@@ -49,3 +57,16 @@ def is_empty_html(html: str) -> bool:
     text = re.sub(r"<[^>]+>", " ", html or "")
     text = unescape(text).replace("\xa0", " ").strip()
     return not text
+
+
+def render_post_html(text: str) -> str:
+    text = str(text or "")
+    if not text:
+        return ""
+    if HTML_TAG_RE.search(text):
+        return sanitize_html(text)
+    return str(linebreaksbr(conditional_escape(text)))
+
+
+def render_comment_html(text: str) -> str:
+    return str(linebreaksbr(conditional_escape(str(text or ""))))
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+
+from base.models import Notification
+
+UNREAD_KEY = "notifications:unread:{}"
+LATEST_KEY = "notifications:latest:{}"
+LATEST_LIMIT = 5
+CACHE_TTL = 5 * 60
+
+
+def unread_count(info_id: int) -> int:
+    key = UNREAD_KEY.format(info_id)
+    value = cache.get(key)
+    if value is None:
+        value = Notification.objects.filter(recipient_id=info_id, is_read=False).count()
+        cache.set(key, value, CACHE_TTL)
+    return int(value)
+
+
+def latest(info_id: int) -> list[Notification]:
+    key = LATEST_KEY.format(info_id)
+    items = cache.get(key)
+    if items is None:
+        items = list(
+            Notification.objects
+            .filter(recipient_id=info_id)
+            .select_related("sender__user")
+            .order_by("-created_at")[:LATEST_LIMIT]
+        )
+        cache.set(key, items, CACHE_TTL)
+    return items
+
+
+def on_created(notification: Notification) -> None:
+    info_id = notification.recipient_id
+    if not notification.is_read:
+        try:
+            cache.incr(UNREAD_KEY.format(info_id))
+        except ValueError:
+            pass
+    cache.delete(LATEST_KEY.format(info_id))
+
+
+def mark_all_read(info_id: int) -> None:
+    cache.set(UNREAD_KEY.format(info_id), 0, CACHE_TTL)
+    cache.delete(LATEST_KEY.format(info_id))
+
+
+def invalidate(info_ids) -> None:
+    keys = []
+    for info_id in set(info_ids or []):
+        keys += [UNREAD_KEY.format(info_id), LATEST_KEY.format(info_id)]
+    if keys:
+        cache.delete_many(keys)
@@ -2,12 +2,13 @@ import logging
 from email.utils import formataddr, parseaddr
 
 from django.conf import settings
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.utils.translation import gettext as _
 from django.utils.translation import override
-from base.models import Notification, AdditionalUserInfo
-from .email_sender import send_email
-from .telegram import send_bot_message
+from base.models import Notification, NotificationOutbox, AdditionalUserInfo
+from .telegram import TelegramMessage, send_bot_messages
+from .telegram_user import _resolve_chat_id
 
 log = logging.getLogger(__name__)
 
@@ -27,62 +28,107 @@ def _brand_from_email() -> str | None:
     return formataddr(("Ритмы жизни", email_address))
 
 
-def _send_telegram(chat_id: int | str, text: str, *, button_text: str | None = None, button_url: str | None = None) -> bool:
-    token = getattr(settings, "TELEGRAM_BOT_TOKEN_USERS", "")
+def _reply_markup(button_text: str | None, button_url: str | None) -> dict | None:
+    if not button_url:
+        return None
+    return {"inline_keyboard": [[{"text": button_text or _("Details"), "url": button_url}]]}
+
+
+def _telegram_chat_id(recipient: AdditionalUserInfo) -> int | None:
+    tg = getattr(recipient, "telegram_account", None)
+    if tg and getattr(tg, "telegram_verified", False) and getattr(tg, "telegram_id", None):
+        return tg.telegram_id
+    return None
+
+
+def _telegram_text(title: str, message: str) -> str:
+    return f"<b>{title}</b>\n{message}" if title else str(message)
+
+
+def _bot_token(bot: str) -> str:
+    if bot == "admin":
+        return getattr(settings, "TELEGRAM_BOT_TOKEN_ADMIN", "") or ""
+    return getattr(settings, "TELEGRAM_BOT_TOKEN_USERS", "") or ""
+
+
+def send_telegram_batch(
+    items, *, bot: str = "users", parse_mode: str | None = "HTML", disable_web_page_preview: bool = False
+) -> list[bool]:
+    items = list(items)
+    token = _bot_token(bot)
     if not token:
-        log.error("telegram.send.error reason=token_missing")
-        return False
-    reply_markup = None
-    if button_url:
-        reply_markup = {"inline_keyboard": [[{"text": button_text or _("Details"), "url": button_url}]]}
-    return send_bot_message(
+        if items:
+            log.error("telegram.send.error reason=token_missing bot=%s", bot)
+        return [False] * len(items)
+    return send_bot_messages(
         token=token,
-        chat_id=chat_id,
-        text=text,
-        parse_mode="HTML",
-        disable_web_page_preview=False,
-        reply_markup=reply_markup,
+        items=[
+            TelegramMessage(chat_id, text, _reply_markup(button_text, button_url))
+            for chat_id, text, button_text, button_url in items
+        ],
+        parse_mode=parse_mode,
+        disable_web_page_preview=disable_web_page_preview,
         logger=log,
     )
 
 
-def _send_email_localized(
+def _plain_telegram_row(chat_id: int | str, text: str, *, bot: str) -> NotificationOutbox:
+    return NotificationOutbox(
+        channel=NotificationOutbox.Channel.TELEGRAM,
+        payload={"chat_id": chat_id, "text": text, "bot": bot, "parse_mode": None, "disable_preview": True},
+    )
+
+
+def enqueue_staff_telegram(text: str) -> int:
+    chat_ids = getattr(settings, "TELEGRAM_STAFF_CHAT_IDS", None) or []
+    if not _bot_token("admin") or not chat_ids:
+        return 0
+    rows = [_plain_telegram_row(cid, text, bot="admin") for cid in chat_ids]
+    with transaction.atomic():
+        NotificationOutbox.objects.bulk_create(rows)
+    return len(rows)
+
+
+def enqueue_user_telegram(recipient: AdditionalUserInfo, text: str, *, notification: Notification | None = None) -> bool:
+    if not _bot_token("users"):
+        return False
+    chat_id = _resolve_chat_id(recipient)
+    if not chat_id:
+        return False
+    row = _plain_telegram_row(chat_id, text, bot="users")
+    row.recipient = recipient
+    row.notification = notification
+    with transaction.atomic():
+        row.save()
+    return True
+
+
+def _email_payload(
     info: AdditionalUserInfo,
-    subject: str,
-    body: str,
     *,
+    title: str = "",
+    message: str = "",
+    url: str = "",
+    subject: str | None = None,
+    body: str | None = None,
     html: str | None = None,
     from_email: str | None = None,
-) -> bool:
+) -> dict | None:
     email = (info.email or getattr(info.user, "email", None) or "").strip()
     if not email:
         log.warning("email.notify.skip user_info_id=%s reason=no_email", info.id)
-        return False
+        return None
 
-    try:
-        with override(info.language or "en"):
-            s = str(subject)
-            b = str(body)
-
-        log.info("email.notify.prepare user_info_id=%s to=%s subject=%s", info.id, email, s[:160])
-        ok = bool(
-            send_email(
-                {
-                    "to": email,
-                    "subject": s,
-                    "text": b,
-                    "html": html,
-                    "from_email": from_email or _brand_from_email(),
-                },
-                logger=log,
-            )
-        )
-        if not ok:
-            log.warning("email.notify.failed user_info_id=%s to=%s", info.id, email)
-        return ok
-    except Exception as exc:
-        log.exception("email.notify.error user_info_id=%s to=%s error=%s", info.id, email, exc)
-        return False
+    with override(info.language or "en"):
+        subject = subject if subject is not None else (title or _("Notification"))
+        body = body if body is not None else (f"{message}\n{url}" if url else message)
+        return {
+            "to": email,
+            "subject": str(subject),
+            "text": str(body),
+            "html": html,
+            "from_email": from_email or _brand_from_email(),
+        }
 
 
 def send_notification_multichannel(
@@ -104,39 +150,106 @@ def send_notification_multichannel(
     email_body: str | None = None,
     email_html: str | None = None,
     email_from: str | None = None,
+    dedupe_key: str | None = None,
 ) -> dict:
     created = None
     payload = dict(payload or {})
 
-    if via_site:
-        payload["skip_telegram"] = True
-        created = Notification.objects.create(
+    with transaction.atomic():
+        if via_site:
+            payload["skip_telegram"] = True
+            created = Notification.objects.create(
+                recipient=recipient,
+                sender=sender,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                url=url,
+                payload=payload,
+                source=source,
+                scope=scope,
+            )
+
+        queued = enqueue_external(
             recipient=recipient,
-            sender=sender,
-            notification_type=notification_type,
+            notification=created,
             title=title,
             message=message,
             url=url,
-            payload=payload,
-            source=source,
-            scope=scope,
+            button_text=button_text,
+            via_telegram=via_telegram,
+            via_email=via_email,
+            email_subject=email_subject,
+            email_body=email_body,
+            email_html=email_html,
+            email_from=email_from,
+            dedupe_key=dedupe_key,
         )
+    return {"notification_id": getattr(created, "id", None), **queued}
+
+
+def _outbox_rows(
+    *,
+    recipient: AdditionalUserInfo,
+    notification: Notification | None = None,
+    title: str = "",
+    message: str,
+    url: str = "",
+    button_text: str | None = None,
+    via_telegram: bool = True,
+    via_email: bool = True,
+    email_subject: str | None = None,
+    email_body: str | None = None,
+    email_html: str | None = None,
+    email_from: str | None = None,
+    dedupe_key: str | None = None,
+) -> list[NotificationOutbox]:
+    rows = []
+    with override(recipient.language or "en"):
+        if via_telegram:
+            chat_id = _telegram_chat_id(recipient)
+            if chat_id:
+                rows.append(NotificationOutbox(
+                    channel=NotificationOutbox.Channel.TELEGRAM,
+                    payload={
+                        "chat_id": chat_id,
+                        "text": _telegram_text(title, message),
+                        "button_text": str(button_text or _("Details")),
+                        "url": url or "",
+                    },
+                ))
+
+        if via_email:
+            email = _email_payload(
+                recipient, title=title, message=message, url=url, subject=email_subject,
+                body=email_body, html=email_html, from_email=email_from,
+            )
+            if email:
+                rows.append(NotificationOutbox(channel=NotificationOutbox.Channel.EMAIL, payload=email))
 
-    tg_sent = False
-    if via_telegram:
-        tg = getattr(recipient, "telegram_account", None)
-        if tg and getattr(tg, "telegram_verified", False) and getattr(tg, "telegram_id", None):
-            tg_text = f"<b>{title}</b>\n{message}" if title else message
-            tg_sent = _send_telegram(tg.telegram_id, tg_text, button_text=button_text, button_url=url or None)
+    for row in rows:
+        row.recipient = recipient
+        row.notification = notification
+        row.dedupe_key = f"{dedupe_key}:{row.channel}" if dedupe_key else None
+    return rows
 
-    mail_sent = False
-    if via_email:
-        subj = email_subject if email_subject is not None else (title or _("Notification"))
-        body = email_body if email_body is not None else (f"{message}\n{url}" if url else message)
-        mail_sent = _send_email_localized(recipient, subj, body, html=email_html, from_email=email_from)
 
+def _queued(rows: list[NotificationOutbox]) -> dict:
+    channels = {row.channel for row in rows}
     return {
-        "notification_id": getattr(created, "id", None),
-        "telegram_sent": tg_sent,
-        "email_sent": mail_sent,
+        "telegram_queued": NotificationOutbox.Channel.TELEGRAM in channels,
+        "email_queued": NotificationOutbox.Channel.EMAIL in channels,
     }
+
+
+def enqueue_external(**delivery) -> dict:
+    return enqueue_external_many([delivery])[0]
+
+
+def enqueue_external_many(deliveries: list[dict]) -> list[dict]:
+    per_delivery = [_outbox_rows(**d) for d in deliveries]
+    rows = [row for group in per_delivery for row in group]
+    NotificationOutbox.objects.bulk_create(
+        rows, batch_size=500, ignore_conflicts=any(row.dedupe_key for row in rows)
+    )
+    return [_queued(group) for group in per_delivery]
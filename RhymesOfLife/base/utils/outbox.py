@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from base.models import NotificationOutbox
+
+from .email_sender import send_emails
+from .logging import get_app_logger
+from .notify import send_telegram_batch
+
+log = get_app_logger(__name__)
+
+BATCH_SIZE = int(getattr(settings, "OUTBOX_BATCH_SIZE", 100))
+MAX_ATTEMPTS = int(getattr(settings, "OUTBOX_MAX_ATTEMPTS", 8))
+RETRY_BASE_SECONDS = int(getattr(settings, "OUTBOX_RETRY_BASE_SECONDS", 30))
+RETRY_MAX_SECONDS = 6 * 3600
+CLAIM_LEASE = timedelta(minutes=10)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    seconds = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0))
+    return timedelta(seconds=seconds + random.uniform(0, seconds / 10))
+
+
+def _send_email_rows(rows: list[NotificationOutbox]) -> list[tuple[bool, str]]:
+    sent = send_emails([dict(r.payload or {}) for r in rows], logger=log)
+    return [(ok, "" if ok else "delivery failed") for ok in sent]
+
+
+def _send_telegram_rows(rows: list[NotificationOutbox]) -> list[tuple[bool, str]]:
+    groups: dict[tuple, list[int]] = {}
+    for i, r in enumerate(rows):
+        p = r.payload or {}
+        key = (p.get("bot") or "users", p.get("parse_mode", "HTML"), bool(p.get("disable_preview")))
+        groups.setdefault(key, []).append(i)
+
+    results: list[tuple[bool, str]] = [(False, "delivery failed")] * len(rows)
+    for (bot, parse_mode, disable_preview), index in groups.items():
+        sent = send_telegram_batch(
+            (
+                (rows[i].payload["chat_id"], rows[i].payload["text"],
+                 rows[i].payload.get("button_text"), rows[i].payload.get("url") or None)
+                for i in index
+            ),
+            bot=bot,
+            parse_mode=parse_mode,
+            disable_web_page_preview=disable_preview,
+        )
+        for i, ok in zip(index, sent):
+            results[i] = (ok, "" if ok else "delivery failed")
+    return results
+
+
+def _claim(limit: int) -> list[NotificationOutbox]:
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            NotificationOutbox.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=NotificationOutbox.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:limit]
+        )
+        if rows:
+            NotificationOutbox.objects.filter(pk__in=[r.pk for r in rows]).update(
+                attempts=F("attempts") + 1, next_attempt_at=now + CLAIM_LEASE, updated_at=now
+            )
+    for row in rows:
+        row.attempts += 1
+    return rows
+
+
+def deliver_pending(*, limit: int = BATCH_SIZE, logger=None) -> int:
+    logger = logger or log
+    rows = _claim(limit)
+    if not rows:
+        return 0
+
+    telegram = [r for r in rows if r.channel == NotificationOutbox.Channel.TELEGRAM]
+    emails = [r for r in rows if r.channel != NotificationOutbox.Channel.TELEGRAM]
+    results = dict(zip(telegram, _send_telegram_rows(telegram)))
+    results.update(zip(emails, _send_email_rows(emails)))
+
+    now = timezone.now()
+    for row in rows:
+        ok, error = results[row]
+        row.updated_at = now
+        row.last_error = error
+        if ok:
+            row.status = NotificationOutbox.Status.SENT
+            row.sent_at = now
+        elif row.attempts >= MAX_ATTEMPTS:
+            row.status = NotificationOutbox.Status.FAILED
+            logger.warning("outbox.deliver.gave_up id=%s channel=%s attempts=%s", row.pk, row.channel, row.attempts)
+        else:
+            row.next_attempt_at = now + retry_delay(row.attempts)
+    NotificationOutbox.objects.bulk_update(rows, ["status", "next_attempt_at", "last_error", "sent_at", "updated_at"])
+
+    sent = sum(1 for ok, _ in results.values() if ok)
+    logger.info("outbox.deliver.batch claimed=%s sent=%s", len(rows), sent)
+    return len(rows)
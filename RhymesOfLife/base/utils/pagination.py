@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+
+
+def encode_cursor(created_at: datetime, pk: int) -> str:
+    raw = f"{created_at.isoformat()}|{pk}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str | None) -> tuple[datetime, int] | None:
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        ts, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(pk)
+    except (ValueError, UnicodeError, binascii.Error):
+        return None
+
+
+def keyset_page(qs, cursor: str | None, *, limit: int, field: str = "created_at", key: str = "id"):
+    qs = qs.order_by(f"-{field}", f"-{key}")
+    position = decode_cursor(cursor)
+    if position:
+        ts, pk = position
+        qs = qs.filter(Q(**{f"{field}__lt": ts}) | Q(**{field: ts, f"{key}__lt": pk}))
+
+    rows = list(qs[: limit + 1])
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, field), getattr(last, key))
+    return items, next_cursor
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from django.conf import settings
+
+from .logging import get_app_logger
+
+try:
+    import redis
+except Exception:
+    redis = None
+
+log = get_app_logger(__name__)
+
+_client = None
+
+
+def get_redis():
+    global _client
+    if not redis:
+        return None
+    if _client is None:
+        try:
+            _client = redis.Redis(
+                host=getattr(settings, "REDIS_HOST", "redis"),
+                port=int(getattr(settings, "REDIS_PORT", 6379)),
+                decode_responses=True,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+        except Exception:
+            log.exception("Redis client init failed")
+            return None
+    return _client
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, NamedTuple
 from urllib.parse import urlsplit, urlunsplit
 
 import requests
@@ -15,9 +18,115 @@ log = get_app_logger(__name__)
 _API = "https://api.telegram.org/bot{token}/{method}"
 _TIMEOUT = 20
 _MAX_RETRIES = 3
-_RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+_RETRYABLE_STATUSES = (500, 502, 503, 504)
+_MAX_RETRY_AFTER = 60
+
+_GLOBAL_RATE = float(getattr(settings, "TELEGRAM_GLOBAL_RATE", 30))
+_CHAT_RATE = float(getattr(settings, "TELEGRAM_CHAT_RATE", 1))
+_GROUP_RATE = float(getattr(settings, "TELEGRAM_GROUP_RATE_PER_MINUTE", 20)) / 60
+_SEND_WORKERS = int(getattr(settings, "TELEGRAM_SEND_WORKERS", 8))
+_MAX_CHAT_BUCKETS = 10000
 
 _session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+class TelegramMessage(NamedTuple):
+    chat_id: int | str
+    text: str
+    reply_markup: dict[str, Any] | None = None
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def block(self, seconds: float) -> None:
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def idle(self, now: float) -> bool:
+        return now - self.updated > 60 and now > self.blocked_until
+
+
+class _RateLimiter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bots: dict[str, _TokenBucket] = {}
+        self._chats: dict[tuple[str, str], _TokenBucket] = {}
+
+    def _bot(self, token: str) -> _TokenBucket:
+        with self._lock:
+            bucket = self._bots.get(token)
+            if bucket is None:
+                bucket = self._bots[token] = _TokenBucket(_GLOBAL_RATE, max(_GLOBAL_RATE, 1))
+            return bucket
+
+    def _chat(self, token: str, chat_id: int | str) -> _TokenBucket:
+        key = (token, str(chat_id))
+        with self._lock:
+            bucket = self._chats.get(key)
+            if bucket is None:
+                if len(self._chats) >= _MAX_CHAT_BUCKETS:
+                    now = time.monotonic()
+                    for k in [k for k, b in self._chats.items() if b.idle(now)]:
+                        del self._chats[k]
+                if _is_group(chat_id):
+                    bucket = _TokenBucket(_GROUP_RATE, 3)
+                else:
+                    bucket = _TokenBucket(_CHAT_RATE, 1)
+                self._chats[key] = bucket
+            return bucket
+
+    def acquire(self, token: str, chat_id: int | str | None = None) -> None:
+        if chat_id is not None:
+            wait = self._chat(token, chat_id).reserve()
+            if wait > 0:
+                time.sleep(wait)
+        wait = self._bot(token).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def block(self, token: str, seconds: float) -> None:
+        self._bot(token).block(seconds)
+
+
+_limiter = _RateLimiter()
+
+
+def _is_group(chat_id: int | str) -> bool:
+    if isinstance(chat_id, int):
+        return chat_id < 0
+    value = str(chat_id).strip()
+    return value.startswith("-") or value.startswith("@")
+
+
+def _retry_after(response: requests.Response) -> float:
+    try:
+        data = response.json() or {}
+        value = (data.get("parameters") or {}).get("retry_after")
+    except (ValueError, AttributeError):
+        value = None
+    if value is None:
+        value = response.headers.get("Retry-After")
+    try:
+        return max(float(value), 1.0)
+    except (TypeError, ValueError):
+        return 1.0
 
 
 def _build_session() -> requests.Session:
@@ -31,7 +140,7 @@ def _build_session() -> requests.Session:
         allowed_methods=frozenset({"GET", "POST"}),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=max(_SEND_WORKERS, 10))
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
@@ -41,7 +150,9 @@ def _build_session() -> requests.Session:
 def _get_session() -> requests.Session:
     global _session
     if _session is None:
-        _session = _build_session()
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
     return _session
 
 
@@ -89,22 +200,31 @@ def _request(
         _MAX_RETRIES,
         proxy_label,
     )
-    try:
-        response = _get_session().request(
-            method=http_method.upper(),
-            url=url,
-            json=payload,
-            timeout=timeout,
-            proxies=proxies,
-        )
-    except requests.RequestException:
-        logger.exception(
-            "telegram.api.exception method=%s proxy=%s payload_keys=%s",
-            method,
-            proxy_label,
-            sorted((payload or {}).keys()),
-        )
-        return None
+    for _attempt in range(_MAX_RETRIES + 1):
+        try:
+            response = _get_session().request(
+                method=http_method.upper(),
+                url=url,
+                json=payload,
+                timeout=timeout,
+                proxies=proxies,
+            )
+        except requests.RequestException:
+            logger.exception(
+                "telegram.api.exception method=%s proxy=%s payload_keys=%s",
+                method,
+                proxy_label,
+                sorted((payload or {}).keys()),
+            )
+            return None
+        if response.status_code != 429:
+            break
+        retry_after = _retry_after(response)
+        logger.warning("telegram.api.throttled method=%s retry_after=%s", method, retry_after)
+        _limiter.block(token, retry_after)
+        if retry_after > _MAX_RETRY_AFTER:
+            break
+        time.sleep(retry_after)
 
     if response.status_code != 200:
         logger.warning(
@@ -145,10 +265,42 @@ def send_bot_message(
     if reply_markup:
         payload["reply_markup"] = reply_markup
 
+    _limiter.acquire(token, chat_id)
     response = telegram_api_post(token, "sendMessage", payload, logger=logger)
     return bool(response and response.status_code == 200)
 
 
+def send_bot_messages(
+    *,
+    token: str,
+    items: Iterable[TelegramMessage | tuple],
+    parse_mode: str | None = None,
+    disable_web_page_preview: bool = True,
+    logger=None,
+) -> list[bool]:
+    items = [TelegramMessage(*item) for item in items]
+    if not items:
+        return []
+
+    def _send(item: TelegramMessage) -> bool:
+        try:
+            return send_bot_message(
+                token=token,
+                chat_id=item.chat_id,
+                text=item.text,
+                parse_mode=parse_mode,
+                disable_web_page_preview=disable_web_page_preview,
+                reply_markup=item.reply_markup,
+                logger=logger,
+            )
+        except Exception:
+            (logger or log).exception("telegram.batch.error chat_id=%s", item.chat_id)
+            return False
+
+    with ThreadPoolExecutor(max_workers=min(_SEND_WORKERS, len(items))) as pool:
+        return list(pool.map(_send, items))
+
+
 def get_bot_username(token: str, *, logger=None) -> str | None:
     response = telegram_api_get(token, "getMe", logger=logger)
     if not response or response.status_code != 200:
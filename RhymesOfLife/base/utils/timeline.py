@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from base.models import AdditionalUserInfo, Follower, Post, TimelineEntry
+from .logging import get_app_logger
+
+log = get_app_logger(__name__)
+
+TIMELINE_MAX_LENGTH = 500
+FAN_OUT_BATCH_SIZE = int(getattr(settings, "TIMELINE_FAN_OUT_BATCH_SIZE", 20))
+VISIBILITY_FIELDS = frozenset({"is_approved", "is_hidden", "is_deleted", "is_hidden_by_reports"})
+
+
+def is_publicly_visible(post: Post) -> bool:
+    return bool(post.is_approved and not post.is_deleted and not post.is_hidden and not post.is_hidden_by_reports)
+
+
+def _public_posts():
+    return Post.objects.filter(is_deleted=False, is_hidden=False, is_hidden_by_reports=False, is_approved=True)
+
+
+def trim_timelines(owner_ids, *, max_length: int = TIMELINE_MAX_LENGTH) -> int:
+    owner_ids = [int(i) for i in owner_ids or []]
+    if not owner_ids:
+        return 0
+    table = TimelineEntry._meta.db_table
+    with connection.cursor() as c:
+        c.execute(
+            f"""
+            DELETE FROM {table} WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY owner_id ORDER BY created_at DESC, post_id DESC
+                    ) AS rn
+                    FROM {table}
+                    WHERE owner_id = ANY(%s)
+                ) ranked
+                WHERE ranked.rn > %s
+            )
+            """,
+            [owner_ids, max_length],
+        )
+        return c.rowcount
+
+
+def fan_out_post(post: Post) -> int:
+    follower_ids = list(
+        Follower.objects.filter(following_id=post.author_id, is_active=True).values_list("follower_id", flat=True)
+    )
+    if not follower_ids:
+        return 0
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(owner_id=fid, post_id=post.id, created_at=post.created_at) for fid in follower_ids],
+        ignore_conflicts=True,
+        batch_size=1000,
+    )
+    trim_timelines(follower_ids)
+    log.info("Timeline fan-out: post_id=%s followers=%s", post.id, len(follower_ids))
+    return len(follower_ids)
+
+
+def remove_post(post_id: int) -> int:
+    deleted, _ = TimelineEntry.objects.filter(post_id=post_id).delete()
+    return deleted
+
+
+def sync_post(post: Post) -> None:
+    if is_publicly_visible(post):
+        fan_out_post(post)
+    else:
+        remove_post(post.id)
+
+
+def schedule_sync(post_ids) -> None:
+    post_ids = list(post_ids)
+    if not post_ids:
+        return
+    visible = set(_public_posts().filter(pk__in=post_ids).values_list("pk", flat=True))
+    if visible:
+        Post.objects.filter(pk__in=visible).update(timeline_pending=True)
+    hidden = [pid for pid in post_ids if pid not in visible]
+    if hidden:
+        TimelineEntry.objects.filter(post_id__in=hidden).delete()
+
+
+def run_pending_fan_outs(*, limit: int = FAN_OUT_BATCH_SIZE, logger=None) -> int:
+    logger = logger or log
+    post_ids = list(Post.objects.filter(timeline_pending=True).order_by("id").values_list("id", flat=True)[:limit])
+    done = 0
+    for post_id in post_ids:
+        try:
+            with transaction.atomic():
+                post = (
+                    Post.objects
+                    .select_for_update(skip_locked=True)
+                    .filter(pk=post_id, timeline_pending=True)
+                    .first()
+                )
+                if post is None:
+                    continue
+                sync_post(post)
+                Post.objects.filter(pk=post_id).update(timeline_pending=False)
+            done += 1
+        except Exception:
+            logger.exception("Timeline fan-out failed: post_id=%s", post_id)
+    return done
+
+
+def backfill_follow(follower: AdditionalUserInfo, following: AdditionalUserInfo) -> int:
+    posts = list(
+        _public_posts()
+        .filter(author=following)
+        .order_by("-created_at", "-id")
+        .values_list("id", "created_at")[:TIMELINE_MAX_LENGTH]
+    )
+    if not posts:
+        return 0
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(owner_id=follower.id, post_id=pid, created_at=created) for pid, created in posts],
+        ignore_conflicts=True,
+        batch_size=1000,
+    )
+    trim_timelines([follower.id])
+    return len(posts)
+
+
+def drop_follow(follower: AdditionalUserInfo, following: AdditionalUserInfo) -> int:
+    deleted, _ = TimelineEntry.objects.filter(owner=follower, post__author=following).delete()
+    return deleted
+
+
+def rebuild_timeline(owner: AdditionalUserInfo) -> int:
+    TimelineEntry.objects.filter(owner=owner).delete()
+    following_ids = Follower.objects.filter(follower=owner, is_active=True).values_list("following_id", flat=True)
+    posts = list(
+        _public_posts()
+        .filter(author__in=following_ids)
+        .order_by("-created_at", "-id")
+        .values_list("id", "created_at")[:TIMELINE_MAX_LENGTH]
+    )
+    TimelineEntry.objects.bulk_create(
+        [TimelineEntry(owner_id=owner.id, post_id=pid, created_at=created) for pid, created in posts],
+        ignore_conflicts=True,
+        batch_size=1000,
+    )
+    return len(posts)
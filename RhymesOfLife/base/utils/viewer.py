@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from base.models import PostLike
+
+from . import notification_cache
+
+
+class ViewerContext:
+    def __init__(self, request):
+        self._request = request
+        self._perms: dict[str, bool] = {}
+        self._liked_posts: dict[int, bool] = {}
+        self._liked_articles: dict[int, bool] = {}
+
+    @property
+    def user(self):
+        return getattr(self._request, "user", None)
+
+    @property
+    def is_authenticated(self) -> bool:
+        user = self.user
+        return bool(user and user.is_authenticated)
+
+    @cached_property
+    def profile(self):
+        if not self.is_authenticated:
+            return None
+        return getattr(self.user, "additional_info", None)
+
+    @cached_property
+    def following_user_ids(self) -> list[int]:
+        me = self.profile
+        if not me:
+            return []
+        return list(me.following.filter(is_active=True).values_list("following__user_id", flat=True))
+
+    @cached_property
+    def unread_notifications_count(self) -> int:
+        me = self.profile
+        if not me:
+            return 0
+        return notification_cache.unread_count(me.pk)
+
+    @cached_property
+    def latest_notifications(self) -> list:
+        me = self.profile
+        if not me:
+            return []
+        return notification_cache.latest(me.pk)
+
+    def has_perm(self, perm: str) -> bool:
+        if not self.is_authenticated:
+            return False
+        if perm not in self._perms:
+            self._perms[perm] = self.user.has_perm(perm)
+        return self._perms[perm]
+
+    @property
+    def can_moderate(self) -> bool:
+        return self.is_authenticated and (self.user.is_staff or self.has_perm("base.moderate_posts"))
+
+    @property
+    def can_view_pending(self) -> bool:
+        return self.is_authenticated and (self.user.is_staff or self.has_perm("base.view_pending_posts"))
+
+    def _liked(self, cache: dict[int, bool], model, fk: str, ids) -> list[int]:
+        ids = [int(i) for i in ids]
+        me = self.profile
+        if not me:
+            return []
+        missing = [i for i in ids if i not in cache]
+        if missing:
+            liked = set(
+                model.objects.filter(author=me, is_active=True, **{f"{fk}__in": missing})
+                .values_list(fk, flat=True)
+            )
+            for i in missing:
+                cache[i] = i in liked
+        return [i for i in ids if cache[i]]
+
+    def liked_post_ids(self, post_ids) -> list[int]:
+        return self._liked(self._liked_posts, PostLike, "post_id", post_ids)
+
+    def liked_article_ids(self, article_ids) -> list[int]:
+        from blog.models import ArticleLike
+
+        return self._liked(self._liked_articles, ArticleLike, "article_id", article_ids)
+
+
+def get_viewer(request) -> ViewerContext:
+    viewer = getattr(request, "viewer", None)
+    if viewer is None:
+        viewer = ViewerContext(request)
+        try:
+            request.viewer = viewer
+        except AttributeError:
+            pass
+    return viewer
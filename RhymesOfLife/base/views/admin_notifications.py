@@ -1,11 +1,13 @@
 import json
 from django.http import JsonResponse, HttpResponseBadRequest
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import render
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
-from ..models import AdditionalUserInfo, Notification
+from ..models import AdditionalUserInfo, BroadcastJob, Notification
+from ..utils.broadcasts import enqueue_broadcast, job_status
 from ..utils.logging import get_app_logger
 from ..utils.decorators import permission_or_staff_required
 from ..utils.notify import send_notification_multichannel
@@ -77,25 +79,27 @@ def admin_notify_api(request):
         )
         return JsonResponse({"status": "ok", "id": res.get("notification_id")})
 
-    sent = 0
-    recipients = AdditionalUserInfo.objects.select_related("user").all()
-    for r in recipients:
-        send_notification_multichannel(
-            recipient=r,
-            sender=sender_info,
-            notification_type=ntype,
-            title=title,
-            message=message,
-            url=url,
-            button_text=button_text,
-            source=source,
-            scope=Notification.Scope.BROADCAST,
-            via_site=True,
-            via_telegram=True,
-            via_email=True,
-        )
-        sent += 1
-    return JsonResponse({"status": "ok", "sent": sent})
+    job = enqueue_broadcast(
+        sender=sender_info,
+        notification_type=ntype,
+        title=title,
+        message=message,
+        url=url,
+        button_text=button_text,
+        source=source,
+    )
+    return JsonResponse({
+        **job_status(job),
+        "status_url": reverse("admin_broadcast_status", args=[job.pk]),
+    }, status=202)
+
+
+@login_required
+@permission_or_staff_required("base.send_notifications")
+@require_http_methods(["GET"])
+def admin_broadcast_status(request, job_id: int):
+    job = get_object_or_404(BroadcastJob, pk=job_id)
+    return JsonResponse(job_status(job))
 
 
 @login_required
@@ -26,7 +26,9 @@ from django.views.decorators.debug import sensitive_post_parameters
 from django.urls import reverse
 from urllib.parse import urlencode
 
-from blog.models import BlogIndexPage, BlogPage
+from blog.blog_index import get_blog_index
+from blog.listing import card_queryset, decorate_cards
+from blog.models import BlogPage
 
 from ..models import AdditionalUserInfo, PasswordResetCode
 from ..utils.logging import get_app_logger, get_security_logger
@@ -398,13 +400,16 @@ def home_public_view(request):
     user = request.user if is_authed else None
     landing_articles = BlogPage.objects.none()
 
-    blog_index = BlogIndexPage.objects.first()
+    blog_index = get_blog_index()
     if blog_index:
-        landing_articles = (
-            BlogPage.objects.live()
-            .descendant_of(blog_index)
-            .filter(is_deleted=False, is_approved=True)
-            .order_by("-first_published_at", "-date")[:3]
+        landing_articles = decorate_cards(
+            card_queryset(
+                BlogPage.objects.live()
+                .descendant_of(blog_index)
+                .filter(is_deleted=False, is_approved=True)
+                .order_by("-first_published_at", "-date")
+            )[:3],
+            request,
         )
 
     def has_consents(i):
@@ -5,24 +5,30 @@ from functools import lru_cache
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 from django.db import transaction
+from django.db.models import F, Prefetch, Window, prefetch_related_objects
+from django.db.models.functions import RowNumber
 from django.http import JsonResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, render, redirect
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext as _
 from django.template.loader import render_to_string
-from django.templatetags.static import static
 from django.views.decorators.http import require_http_methods, require_POST
 from django.utils.timezone import localtime
 from django.views.decorators.csrf import csrf_protect
 
 from base.models import AdditionalUserInfo
-from base.models import Post, PostImage, PostLike, PostComment, PostReport, get_syndrome_choices
+from base.models import Post, PostImage, PostLike, PostComment, PostReport, TimelineEntry, get_syndrome_choices
 from base.utils.files import validate_mixed_upload
 from base.utils.html import sanitize_html, is_empty_html
 from base.utils.moderation import get_moderation_config
+from base.utils.avatars import avatar_urls
+from base.utils.pagination import encode_cursor, keyset_page
+from base.utils import counter_buffer
+from base.utils.counters import apply_delta, mark_flag, toggle_active
 from base.utils.decorators import permission_or_staff_required
 from base.utils.logging import get_app_logger
+from base.utils.viewer import get_viewer
 
 log = get_app_logger(__name__)
 
@@ -31,7 +37,10 @@ ALLOWED_IMAGE_MIMES = {"image/jpeg", "image/png", "image/webp", "image/gif"}
 MAX_FILE_SIZE_BYTES = 20 * 1024 * 1024
 MAX_IMAGE_SIDE_PX = 10_000
 MAX_IMAGES_PER_POST = 10
+FEED_PAGE_SIZE = 10
 FIRST_COMMENTS_LIMIT = 3
+COMMENTS_PAGE_SIZE = 10
+COMMENTS_PAGE_MAX = 50
 AUTO_CENSOR_REPORTS = 15
 
 
@@ -59,15 +68,15 @@ def _report_threshold():
 
 
 def _me(request):
-    return AdditionalUserInfo.objects.filter(user=request.user).first() if request.user.is_authenticated else None
+    return get_viewer(request).profile
 
 
-def _can_view_pending(user):
-    return user.is_staff or user.has_perm("base.view_pending_posts")
+def _can_view_pending(request):
+    return get_viewer(request).can_view_pending
 
 
-def _can_moderate(user):
-    return user.is_staff or user.has_perm("base.moderate_posts")
+def _can_moderate(request):
+    return get_viewer(request).can_moderate
 
 
 @lru_cache(maxsize=1)
@@ -99,11 +108,46 @@ def _public_syndrome_names(info: AdditionalUserInfo | None) -> list[str]:
     return names
 
 
+def _attach_card_relations(posts):
+    by_id = {post.id: post for post in posts}
+    if not by_id:
+        return
+
+    prefetch_related_objects(
+        posts,
+        Prefetch("images", queryset=PostImage.objects.order_by("id"), to_attr="card_images"),
+    )
+
+    first_comments = (
+        PostComment.objects
+        .filter(post_id__in=list(by_id), is_deleted=False)
+        .select_related("author__user")
+        .annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F("post_id")],
+                order_by=[F("created_at").desc(), F("id").desc()],
+            )
+        )
+        .filter(row_number__lte=FIRST_COMMENTS_LIMIT)
+        .order_by("post_id", "row_number")
+    )
+    for post in posts:
+        post.first_comments = []
+    for comment in first_comments:
+        by_id[comment.post_id].first_comments.append(comment)
+    for post in posts:
+        last = post.first_comments[-1] if post.first_comments else None
+        post.comments_cursor = encode_cursor(last.created_at, last.id) if last else ""
+
+
 def _decorate_posts_for_display(posts):
-    for post in posts or []:
+    posts = list(posts or [])
+    for post in posts:
         author = getattr(post, "author", None)
         if author is not None:
             author.public_syndrome_names = _public_syndrome_names(author)
+    _attach_card_relations(posts)
     return posts
 
 
@@ -114,21 +158,30 @@ def _feed_queryset(request):
     public_base = base.filter(is_hidden=False, is_hidden_by_reports=False, is_approved=True)
 
     if f == "mine" and request.user.is_authenticated:
-        me = _me(request)
-        qs = base.filter(author=me).order_by("-created_at")
+        qs = base.filter(author=_me(request)).order_by("-created_at", "-id")
     elif f == "subscriptions" and request.user.is_authenticated:
-        me = _me(request)
-        follow_ids = me.following.filter(is_active=True).values_list("following_id", flat=True)
-        qs = public_base.filter(author__in=follow_ids).order_by("-created_at")
-    elif f == "pending" and _can_view_pending(request.user):
-        qs = base.filter(is_approved=False, is_hidden_by_reports=False).order_by("-created_at")
+        qs = TimelineEntry.objects.filter(owner=_me(request)).order_by("-created_at", "-post_id")
+    elif f == "pending" and _can_view_pending(request):
+        qs = base.filter(is_approved=False, is_hidden_by_reports=False).order_by("-created_at", "-id")
     else:
         f = "latest"
-        qs = public_base.order_by("-created_at")
+        qs = public_base.order_by("-created_at", "-id")
 
     return f, qs
 
 
+def _timeline_posts(entries):
+    post_ids = [e.post_id for e in entries]
+    by_id = (
+        Post.objects.filter(
+            id__in=post_ids, is_deleted=False, is_hidden=False, is_hidden_by_reports=False, is_approved=True
+        )
+        .select_related("author__user")
+        .in_bulk()
+    )
+    return [by_id[pid] for pid in post_ids if pid in by_id]
+
+
 def _render_post_list_fragment(request, context):
     html = render_to_string("base/post_list_fragment.html", context, request=request)
     return html
@@ -153,20 +206,25 @@ def feed(request):
         return render(request, "base/info/main.html")
 
     f, qs = _feed_queryset(request)
-    paginator = Paginator(qs, 10)
-    page_obj = paginator.get_page(request.GET.get("page"))
-    _decorate_posts_for_display(page_obj.object_list)
-
-    liked_ids = []
-    following_user_ids = set()
+    cursor_mode = "page" not in request.GET
+    next_cursor = None
+    key = "post_id" if f == "subscriptions" else "id"
+    if cursor_mode:
+        page_obj, next_cursor = keyset_page(qs, request.GET.get("cursor"), limit=FEED_PAGE_SIZE, key=key)
+        if f == "subscriptions":
+            page_obj = _timeline_posts(page_obj)
+        page_posts = page_obj
+    else:
+        page_obj = Paginator(qs, FEED_PAGE_SIZE).get_page(request.GET.get("page"))
+        if f == "subscriptions":
+            page_obj.object_list = _timeline_posts(page_obj.object_list)
+        page_posts = page_obj.object_list
+    _decorate_posts_for_display(page_posts)
 
-    me = _me(request)
-    if me:
-        liked_ids = list(
-            PostLike.objects.filter(author=me, is_active=True, post__in=page_obj.object_list)
-            .values_list("post_id", flat=True)
-        )
-        following_user_ids = set(me.following.filter(is_active=True).values_list("following__user_id", flat=True))
+    viewer = get_viewer(request)
+    me = viewer.profile
+    liked_ids = viewer.liked_post_ids(p.id for p in page_posts)
+    following_user_ids = viewer.following_user_ids
 
     threshold = _report_threshold()
 
@@ -180,9 +238,12 @@ def feed(request):
 
     context = {
         "posts": page_obj,
+        "cursor_mode": cursor_mode,
+        "cursor": request.GET.get("cursor") or "",
+        "next_cursor": next_cursor,
         "current_filter": f,
         "liked_ids": liked_ids,
-        "following_user_ids": list(following_user_ids),
+        "following_user_ids": following_user_ids,
         "FIRST_COMMENTS_LIMIT": FIRST_COMMENTS_LIMIT,
         "info": me,
         "profile_user": request.user,
@@ -192,7 +253,7 @@ def feed(request):
 
     if request.headers.get("x-requested-with") == "XMLHttpRequest":
         html = _render_post_list_fragment(request, context)
-        return JsonResponse({"html": html})
+        return JsonResponse({"html": html, "next_cursor": next_cursor, "has_more": bool(next_cursor)})
 
     return render(request, "base/feed.html", context)
 
@@ -206,7 +267,7 @@ def create_post(request):
         # supports ajax modal/form fetch if needed later
         return render(request, "base/post_create.html")
 
-    me = AdditionalUserInfo.objects.get(user=request.user)
+    me = _me(request)
     text = sanitize_html((request.POST.get("text") or "").strip())
     files = request.FILES.getlist("images")
 
@@ -219,7 +280,7 @@ def create_post(request):
             return JsonResponse({"ok": False, "errors": errors}, status=400)
         return render(request, "base/post_create.html", {"errors": errors, "text": text})
 
-    auto = _can_moderate(request.user) or not me.censorship_enabled
+    auto = _can_moderate(request) or not me.censorship_enabled
 
     post = Post.objects.create(
         author=me,
@@ -233,7 +294,7 @@ def create_post(request):
 
     if request.headers.get("x-requested-with") == "XMLHttpRequest":
         liked_ids = []
-        following_user_ids = set(me.following.filter(is_active=True).values_list("following__user_id", flat=True))
+        following_user_ids = get_viewer(request).following_user_ids
         card_html = _render_single_post_card(
             request, post, liked_ids=liked_ids, following_user_ids=following_user_ids, current_filter="mine"
         )
@@ -269,9 +330,6 @@ def edit_post(request, post_id: int):
                 return JsonResponse({"ok": False, "errors": errors}, status=400)
             return render(request, "base/post_edit.html", {"post": post, "errors": errors, "text": text})
 
-        post.text = text
-        post.save(update_fields=["text"])
-
         if remove_ids:
             ids = [int(i) for i in remove_ids if str(i).isdigit()]
             qs = PostImage.objects.filter(post=post, pk__in=ids)
@@ -284,11 +342,13 @@ def edit_post(request, post_id: int):
         for f in files:
             PostImage.objects.create(post=post, image=f)
 
+        post.text = text
+        post.save(update_fields=["text"])
+
         if request.headers.get("x-requested-with") == "XMLHttpRequest":
-            liked_ids = list(
-                PostLike.objects.filter(post=post, is_active=True, author=me).values_list("post_id", flat=True)
-            )
-            following_user_ids = set(me.following.filter(is_active=True).values_list("following__user_id", flat=True))
+            viewer = get_viewer(request)
+            liked_ids = viewer.liked_post_ids([post.id])
+            following_user_ids = viewer.following_user_ids
             html = _render_single_post_card(
                 request, post, liked_ids=liked_ids, following_user_ids=following_user_ids
             )
@@ -310,7 +370,7 @@ def edit_post(request, post_id: int):
 @csrf_protect
 def report_post(request, post_id: int):
     post = get_object_or_404(Post, pk=post_id, is_deleted=False)
-    me = AdditionalUserInfo.objects.get(user=request.user)
+    me = _me(request)
     if post.author_id == me.id:
         return JsonResponse({"error": _("You cannot report your own post.")}, status=400)
 
@@ -385,38 +445,30 @@ def unhide_post(request, post_id: int):
 @csrf_protect
 def toggle_like(request, post_id: int):
     post = get_object_or_404(Post, pk=post_id, is_deleted=False)
-    me = AdditionalUserInfo.objects.get(user=request.user)
+    me = _me(request)
     like, created = PostLike.objects.get_or_create(post=post, author=me, defaults={"is_active": True})
-    if not created:
-        like.is_active = not like.is_active
-        like.save(update_fields=["is_active"])
-
-    post.likes_count = PostLike.objects.filter(post=post, is_active=True).count()
-    post.save(update_fields=["likes_count"])
+    delta = 1 if created else toggle_active(like)
+    post.likes_count = counter_buffer.bump(Post, post.pk, "likes_count", delta, current=post.likes_count)
 
     return JsonResponse({"liked": like.is_active, "like_count": post.likes_count})
 
 
-def serialize_comment(c, request):
+def serialize_comment(c, request, *, avatars=None, can_moderate=None):
     info = c.author
     user = info.user
-    can_delete = (user == request.user) or _can_moderate(request.user)
-    avatar_url = static("img/avatar-default.png")
-    avatar = getattr(info, "avatar", None)
-    if avatar and getattr(avatar, "name", ""):
-        try:
-            avatar_url = avatar.url
-        except ValueError:
-            avatar_url = static("img/avatar-default.png")
+    if can_moderate is None:
+        can_moderate = _can_moderate(request)
+    if avatars is None:
+        avatars = avatar_urls([info])
     return {
         "id": c.id,
         "post": c.post_id,
         "author": {
             "username": user.username,
-            "avatar": avatar_url,
+            "avatar": avatars.get(info.pk, ""),
         },
         "created_at": localtime(c.created_at).isoformat(),
-        "can_delete": can_delete,
+        "can_delete": (user == request.user) or can_moderate,
         "text": c.text,
     }
 
@@ -427,14 +479,13 @@ def serialize_comment(c, request):
 def add_comment(request, post_id: int):
     try:
         post = get_object_or_404(Post, pk=post_id, is_deleted=False)
-        me = AdditionalUserInfo.objects.get(user=request.user)
+        me = _me(request)
         text = (request.POST.get("text") or "").strip()
         if not text:
             return JsonResponse({"error": "empty"}, status=400)
 
         c = PostComment.objects.create(post=post, author=me, text=text)
-        post.comments_count = PostComment.objects.filter(post=post, is_deleted=False).count()
-        post.save(update_fields=["comments_count"])
+        post.comments_count = apply_delta(Post, post.pk, "comments_count", 1)
 
         data = serialize_comment(c, request)
         log.info("Post comment added: post_id=%s comment_id=%s user_id=%s", post.id, c.id, request.user.id)
@@ -450,13 +501,10 @@ def add_comment(request, post_id: int):
 def delete_comment(request, post_id: int, comment_id: int):
     post = get_object_or_404(Post, pk=post_id, is_deleted=False)
     c = get_object_or_404(PostComment, pk=comment_id, post=post)
-    if c.author.user != request.user and not _can_moderate(request.user):
+    if c.author.user != request.user and not _can_moderate(request):
         return HttpResponseForbidden()
-    c.is_deleted = True
-    c.save(update_fields=["is_deleted"])
-
-    post.comments_count = PostComment.objects.filter(post=post, is_deleted=False).count()
-    post.save(update_fields=["comments_count"])
+    delta = -1 if mark_flag(c, "is_deleted") else 0
+    post.comments_count = apply_delta(Post, post.pk, "comments_count", delta)
 
     return JsonResponse({"ok": True, "count": post.comments_count})
 
@@ -464,25 +512,20 @@ def delete_comment(request, post_id: int, comment_id: int):
 @login_required
 @require_http_methods(["GET"])
 def comments_more(request, post_id: int):
-    post = get_object_or_404(Post, pk=post_id, is_deleted=False)
+    post = get_object_or_404(Post.objects.only("id"), pk=post_id, is_deleted=False)
     try:
-        offset = int(request.GET.get("offset", 0))
-        limit = int(request.GET.get("limit", 10))
+        limit = int(request.GET.get("limit", COMMENTS_PAGE_SIZE))
     except ValueError:
-        offset, limit = 0, 10
+        limit = COMMENTS_PAGE_SIZE
+    limit = max(1, min(limit, COMMENTS_PAGE_MAX))
 
-    base_qs = (
-        PostComment.objects
-        .filter(post=post, is_deleted=False)
-        .order_by("-created_at", "-id")
-    )
-    total = base_qs.count()
-    comments = list(base_qs[offset: offset + limit])
-    items = [serialize_comment(c, request) for c in comments]
+    qs = PostComment.objects.filter(post=post, is_deleted=False).select_related("author__user")
+    comments, next_cursor = keyset_page(qs, request.GET.get("cursor"), limit=limit)
 
-    has_more = offset + limit < total
-    next_offset = offset + limit
-    return JsonResponse({"items": items, "has_more": has_more, "next_offset": next_offset})
+    avatars = avatar_urls(c.author for c in comments)
+    can_moderate = _can_moderate(request)
+    items = [serialize_comment(c, request, avatars=avatars, can_moderate=can_moderate) for c in comments]
+    return JsonResponse({"items": items, "has_more": next_cursor is not None, "next_cursor": next_cursor})
 
 
 @login_required
@@ -8,8 +8,11 @@ from django.template.loader import render_to_string
 from django.utils.translation import gettext as _
 from django.views.decorators.http import require_http_methods
 
-from blog.models import BlogIndexPage, BlogPage
-from base.models import Post, PostLike
+from blog.blog_index import get_blog_index
+from blog.listing import card_queryset, paginate_cards
+from blog.models import BlogPage
+from base.models import Post
+from base.utils.viewer import get_viewer
 from ..models import get_syndrome_choices
 from .feed_views import _decorate_posts_for_display
 
@@ -50,7 +53,7 @@ def public_profile_view(request, username: str):
     pp = _to_int(request.GET.get("ppage"), 1)
 
     articles_qs = BlogPage.objects.none()
-    root = BlogIndexPage.objects.first()
+    root = get_blog_index()
     if root:
         articles_qs = (
             BlogPage.objects.live()
@@ -78,21 +81,13 @@ def public_profile_view(request, username: str):
 
     posts_total = posts_qs.count()
 
-    articles = Paginator(articles_qs, 10).get_page(ap) if can_see_articles else None
+    articles = paginate_cards(Paginator(card_queryset(articles_qs), 10), ap, request) if can_see_articles else None
     posts = Paginator(posts_qs, 10).get_page(pp)
     _decorate_posts_for_display(posts.object_list)
 
-    liked_ids = []
-    following_user_ids = []
-    if request.user.is_authenticated and hasattr(request.user, "additional_info") and posts:
-        me = request.user.additional_info
-        liked_ids = list(
-            PostLike.objects.filter(author=me, is_active=True, post__in=posts.object_list)
-            .values_list("post_id", flat=True)
-        )
-        following_user_ids = list(
-            me.following.filter(is_active=True).values_list("following__user_id", flat=True)
-        )
+    viewer = get_viewer(request)
+    liked_ids = viewer.liked_post_ids(p.id for p in posts.object_list)
+    following_user_ids = viewer.following_user_ids
 
     ctx = {
         "profile_user": user,
@@ -12,6 +12,7 @@ from django.contrib.auth import get_user_model
 
 from ..models import AdditionalUserInfo, Notification
 from ..utils.logging import get_app_logger
+from ..utils import notification_cache, timeline
 
 User = get_user_model()
 log = get_app_logger(__name__)
@@ -36,6 +37,11 @@ def follow_view(request, user_id: int):
     else:
         me.following.create(following=target, is_active=True)
 
+    try:
+        timeline.backfill_follow(me, target)
+    except Exception:
+        log.exception("Timeline backfill failed: follower=%s target=%s", me.user_id, target.user_id)
+
     try:
         Notification.objects.create(
             recipient=target,
@@ -82,6 +88,11 @@ def unfollow_view(request, user_id: int):
     else:
         rel.delete()
 
+    try:
+        timeline.drop_follow(me, target)
+    except Exception:
+        log.exception("Timeline cleanup failed: follower=%s target=%s", me.user_id, target.user_id)
+
     try:
         followers_count = target.followers.filter(is_active=True).count()
     except Exception:
@@ -98,6 +109,7 @@ def notifications_view(request):
     user_info = request.user.additional_info
     qs = user_info.notifications.select_related("sender__user").order_by("-created_at")
     updated = qs.filter(is_read=False).update(is_read=True)
+    notification_cache.mark_all_read(user_info.pk)
     if updated:
         log.info("Notifications marked read: user_id=%s count=%s", request.user.id, updated)
     return render(request, "base/notifications.html", {"notifications": qs})
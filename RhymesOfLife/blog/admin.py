@@ -14,3 +14,10 @@ class ArticleLike(admin.ModelAdmin):
 @admin.register(BlogPage)
 class BlogPage(admin.ModelAdmin):
     pass
+
+
+@admin.register(ArticleNotificationJob)
+class ArticleNotificationJob(admin.ModelAdmin):
+    list_display = ("id", "article", "status", "processed_count", "attempts", "created_at", "finished_at")
+    list_filter = ("status",)
+    raw_id_fields = ("article",)
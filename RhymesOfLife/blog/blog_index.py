@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import BlogIndexPage
+
+CACHE_TTL_SECONDS = 300
+VERSION_KEY = "blog:index:version"
+
+_lock = threading.Lock()
+_state: dict = {}
+
+
+def _version() -> int:
+    return cache.get_or_set(VERSION_KEY, time.time_ns(), None)
+
+
+def _load() -> dict:
+    version = _version()
+    return {
+        "page": BlogIndexPage.objects.first(),
+        "version": version,
+        "expires_at": time.monotonic() + CACHE_TTL_SECONDS,
+    }
+
+
+def _fresh(state: dict) -> bool:
+    return bool(state) and state["expires_at"] > time.monotonic() and state["version"] == _version()
+
+
+def _current() -> dict:
+    global _state
+    state = _state
+    if _fresh(state):
+        return state
+    with _lock:
+        if not _fresh(_state):
+            _state = _load()
+        return _state
+
+
+def get_blog_index() -> BlogIndexPage | None:
+    return _current()["page"]
+
+
+def _bump_version() -> None:
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate() -> None:
+    global _state
+    with _lock:
+        _state = {}
+    transaction.on_commit(_bump_version)
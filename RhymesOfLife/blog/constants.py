@@ -10,3 +10,11 @@ PREDEFINED_TAGS = [
     "Новости",
     "Интервью",
 ]
+
+COMMENTS_PAGE_SIZE = 10
+COMMENTS_PAGE_MAX = 50
+WORDS_PER_MINUTE = 200
+
+CARD_RENDITIONS = ("width-960|format-webp", "width-640|format-webp")
+HERO_RENDITIONS = ("width-640|format-webp", "width-1024|format-webp", "width-1280|format-webp")
+ARTICLE_RENDITIONS = tuple(dict.fromkeys(CARD_RENDITIONS + HERO_RENDITIONS))
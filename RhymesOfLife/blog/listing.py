@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.db.models import Prefetch
+from wagtail.images import get_image_model
+
+from base.utils.avatars import avatar_urls
+from base.utils.viewer import get_viewer
+
+from .constants import CARD_RENDITIONS
+
+
+def card_queryset(queryset):
+    images = get_image_model().objects.prefetch_renditions(*CARD_RENDITIONS)
+    return (
+        queryset.select_related("author__user")
+        .defer("body", "plain_body", "search_vector")
+        .prefetch_related(Prefetch("main_image", queryset=images))
+    )
+
+
+def decorate_cards(pages, request=None) -> list:
+    pages = list(pages)
+    avatars = avatar_urls(p.author for p in pages)
+    liked = set(get_viewer(request).liked_article_ids(p.pk for p in pages)) if request else set()
+    for page in pages:
+        page.card_url = page.get_url(request=request) if page.live else ""
+        page.card_avatar_url = avatars.get(page.author_id, "")
+        page.card_liked = page.pk in liked
+    return pages
+
+
+def paginate_cards(paginator, number, request=None):
+    page_obj = paginator.get_page(number)
+    page_obj.object_list = decorate_cards(page_obj.object_list, request)
+    return page_obj
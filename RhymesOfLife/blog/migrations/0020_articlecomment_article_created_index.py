@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0019_rename_blog_articl_enabled_5418df_idx_blog_articl_enabled_0d609b_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlecomment',
+            index=models.Index(fields=['article', '-created_at', '-id'], name='blog_articl_article_69412b_idx'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:08
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import F, Func, OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat
+
+SEARCH_CONFIGS = ('russian', 'english')
+
+
+def build_search_vector(BlogPageTag):
+    tag_names = Subquery(
+        BlogPageTag.objects.filter(content_object_id=OuterRef('pk'))
+        .order_by()
+        .values('content_object_id')
+        .annotate(names=StringAgg('tag__name', ' '))
+        .values('names')[:1]
+    )
+    author_name = Concat(
+        Coalesce(F('author__first_name'), Value('')),
+        Value(' '),
+        Coalesce(F('author__last_name'), Value('')),
+        output_field=TextField(),
+    )
+    body = Func(F('body'), Value('<[^>]+>'), Value(' '), Value('g'), function='regexp_replace', output_field=TextField())
+    vector = SearchVector(tag_names, author_name, weight='B', config='simple')
+    for config in SEARCH_CONFIGS:
+        vector = (
+            vector
+            + SearchVector('title', weight='A', config=config)
+            + SearchVector('intro', weight='B', config=config)
+            + SearchVector(body, weight='C', config=config)
+        )
+    return vector
+
+
+def backfill_search_vectors(apps, schema_editor):
+    BlogPage = apps.get_model('blog', 'BlogPage')
+    BlogPageTag = apps.get_model('blog', 'BlogPageTag')
+    computed = (
+        BlogPage.objects.filter(pk=OuterRef('pk'))
+        .annotate(vector=build_search_vector(BlogPageTag))
+        .values('vector')[:1]
+    )
+    BlogPage.objects.update(search_vector=Subquery(computed))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0020_articlecomment_article_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpage',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='blogpage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blog_blogpa_search__b41bdf_gin'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0021_blogpage_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleNotificationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('cancelled', 'Cancelled')], db_index=True, default='pending', max_length=16)),
+                ('url', models.CharField(blank=True, max_length=500)),
+                ('last_subscription_id', models.BigIntegerField(default=0)),
+                ('processed_count', models.PositiveIntegerField(default=0)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='notification_job', to='blog.blogpage')),
+            ],
+            options={
+                'verbose_name': 'Article notification job',
+                'verbose_name_plural': 'Article notification jobs',
+            },
+        ),
+    ]
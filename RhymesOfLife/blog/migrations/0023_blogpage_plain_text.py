@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0022_articlenotificationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpage',
+            name='plain_body',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpage',
+            name='preview',
+            field=models.CharField(blank=True, editable=False, max_length=280),
+        ),
+        migrations.AddField(
+            model_name='blogpage',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
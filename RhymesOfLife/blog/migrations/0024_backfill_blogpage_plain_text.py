@@ -0,0 +1,81 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:40
+
+import html
+import re
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import F, OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+PREVIEW_MAX_LENGTH = 280
+BATCH_SIZE = 200
+SEARCH_CONFIGS = ('russian', 'english')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def plain_text_from_html(value):
+    text = html.unescape(strip_tags(value or ''))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def build_search_vector(BlogPageTag):
+    tag_names = Subquery(
+        BlogPageTag.objects.filter(content_object_id=OuterRef('pk'))
+        .order_by()
+        .values('content_object_id')
+        .annotate(names=StringAgg('tag__name', ' '))
+        .values('names')[:1]
+    )
+    author_name = Concat(
+        Coalesce(F('author__first_name'), Value('')),
+        Value(' '),
+        Coalesce(F('author__last_name'), Value('')),
+        output_field=TextField(),
+    )
+    vector = SearchVector(tag_names, author_name, weight='B', config='simple')
+    for config in SEARCH_CONFIGS:
+        vector = (
+            vector
+            + SearchVector('title', weight='A', config=config)
+            + SearchVector('intro', weight='B', config=config)
+            + SearchVector('plain_body', weight='C', config=config)
+        )
+    return vector
+
+
+def backfill_plain_text(apps, schema_editor):
+    BlogPage = apps.get_model('blog', 'BlogPage')
+    BlogPageTag = apps.get_model('blog', 'BlogPageTag')
+    batch = []
+    for page in BlogPage.objects.only('id', 'body').order_by('id').iterator(chunk_size=BATCH_SIZE):
+        page.plain_body = plain_text_from_html(page.body)
+        page.preview = Truncator(page.plain_body).chars(PREVIEW_MAX_LENGTH) if page.plain_body else ''
+        page.word_count = len(page.plain_body.split())
+        batch.append(page)
+        if len(batch) >= BATCH_SIZE:
+            BlogPage.objects.bulk_update(batch, ['plain_body', 'preview', 'word_count'])
+            batch = []
+    if batch:
+        BlogPage.objects.bulk_update(batch, ['plain_body', 'preview', 'word_count'])
+
+    computed = (
+        BlogPage.objects.filter(pk=OuterRef('pk'))
+        .annotate(vector=build_search_vector(BlogPageTag))
+        .values('vector')[:1]
+    )
+    BlogPage.objects.update(search_vector=Subquery(computed))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0023_blogpage_plain_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_plain_text, migrations.RunPython.noop),
+    ]
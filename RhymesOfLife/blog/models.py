@@ -1,10 +1,8 @@
-import html
-import re
-
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth import get_user_model
 from django.core.paginator import Paginator
-from django.db.models import Q
 from django.http import Http404, JsonResponse
 from django.template.loader import render_to_string
 from django.template.response import TemplateResponse
@@ -13,7 +11,6 @@ from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import gettext as _g
 from django.utils.encoding import force_str
-from django.utils.html import strip_tags
 from django.utils.text import Truncator
 
 from wagtail.models import Page
@@ -25,6 +22,14 @@ from modelcluster.contrib.taggit import ClusterTaggableManager
 from taggit.models import TaggedItemBase
 
 from base.models import AdditionalUserInfo
+from base.utils.avatars import avatar_urls
+from base.utils.pagination import keyset_page
+from base.utils.viewer import get_viewer
+
+from . import page_cache
+from .constants import COMMENTS_PAGE_SIZE, WORDS_PER_MINUTE
+from .listing import card_queryset, paginate_cards
+from .search import apply_search, plain_text_from_html, refresh_search_vectors
 
 User = get_user_model()
 ARTICLE_INTRO_MAX_LENGTH = 500
@@ -96,28 +101,25 @@ class BlogIndexPage(Page):
             qs = published
 
         if query:
-            qs = qs.filter(
-                Q(title__icontains=query)
-                | Q(tags__name__icontains=query)
-                | Q(author__first_name__icontains=query)
-                | Q(author__last_name__icontains=query)
-            ).distinct()
+            qs = apply_search(qs, query)
 
         if sort == "popular":
             qs = qs.order_by("-likes_count", "-date", "-first_published_at")
+        elif query:
+            sort = "date"
+            qs = qs.order_by("-search_rank", "-date", "-first_published_at")
         else:
             sort = "date"
             qs = qs.order_by("-date", "-first_published_at", "-latest_revision_created_at")
 
-        return qs, current_filter, sort, query
+        return card_queryset(qs), current_filter, sort, query
 
     def get_context(self, request):
         context = super().get_context(request)
         qs, current_filter, sort, query = self._base_context_queryset(request)
 
         paginator = Paginator(qs, self.posts_per_page)
-        page_num = request.GET.get("page")
-        page_obj = paginator.get_page(page_num)
+        page_obj = paginate_cards(paginator, request.GET.get("page"), request)
 
         subscription_settings = None
         if getattr(request.user, "is_authenticated", False):
@@ -138,9 +140,17 @@ class BlogIndexPage(Page):
         )
         return context
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        page_cache.invalidate()
+        return result
+
     def serve(self, request, *args, **kwargs):
         translation.activate(request.LANGUAGE_CODE)
         request.LANGUAGE_CODE = translation.get_language()
+        return page_cache.serve_cached(request, lambda: self._render(request))
+
+    def _render(self, request):
         context = self.get_context(request)
         if request.headers.get("x-requested-with") == "XMLHttpRequest":
             html = render_to_string(
@@ -199,6 +209,16 @@ class BlogPage(Page):
         related_name="rejected_articles", verbose_name=_("Rejected by")
     )
     subscribers_notified_at = models.DateTimeField(_("Subscribers notified at"), null=True, blank=True, db_index=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    plain_body = models.TextField(blank=True, editable=False)
+    preview = models.CharField(max_length=ARTICLE_CARD_PREVIEW_MAX_LENGTH, blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+
+    SEARCH_FIELDS = frozenset({"title", "intro", "body", "author"})
+    PLAIN_TEXT_FIELDS = frozenset({"plain_body", "preview", "word_count"})
+
+    class Meta:
+        indexes = [GinIndex(fields=["search_vector"])]
 
     content_panels = Page.content_panels + [
         FieldPanel("date"),
@@ -215,32 +235,70 @@ class BlogPage(Page):
     def is_draft(self):
         return not self.live
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "body" in update_fields:
+            self.refresh_plain_text()
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | self.PLAIN_TEXT_FIELDS
+        result = super().save(*args, **kwargs)
+        if update_fields is None or self.SEARCH_FIELDS.intersection(update_fields):
+            refresh_search_vectors(BlogPage.objects.filter(pk=self.pk), BlogPageTag)
+        page_cache.invalidate(self.pk)
+        return result
+
+    @property
+    def is_public(self):
+        return self.live and self.is_approved and not self.is_hidden and not self.is_deleted
+
     def serve(self, request, *args, **kwargs):
         translation.activate(request.LANGUAGE_CODE)
         request.LANGUAGE_CODE = translation.get_language()
-
+        if self.is_public:
+            return page_cache.serve_cached(request, lambda: self._render(request), article_id=self.pk)
+        return self._render(request)
+
+    def _first_comments(self):
+        qs = self.visible_comments.select_related("author__user")
+        comments, next_cursor = keyset_page(qs, None, limit=COMMENTS_PAGE_SIZE)
+        avatars = avatar_urls(c.author for c in comments)
+        for comment in comments:
+            comment.avatar_url = avatars.get(comment.author_id, "")
+        return comments, next_cursor
+
+    def _response(self, request):
+        liked = self.pk in get_viewer(request).liked_article_ids([self.pk])
+        comments, comments_cursor = self._first_comments()
+        return TemplateResponse(request, self.get_template(request), {
+            "page": self,
+            "liked": liked,
+            "comments": comments,
+            "comments_cursor": comments_cursor,
+        })
+
+    def _render(self, request):
         if self.is_draft:
             if request.user.is_authenticated and self.author and self.author.user == request.user:
-                return TemplateResponse(request, self.get_template(request), {"page": self})
+                return self._response(request)
             if request.user.is_staff:
-                return TemplateResponse(request, self.get_template(request), {"page": self})
+                return self._response(request)
             raise Http404
 
         if self.is_hidden:
             if request.user.is_authenticated and self.author and self.author.user == request.user:
-                return TemplateResponse(request, self.get_template(request), {"page": self})
+                return self._response(request)
             if request.user.is_staff:
-                return TemplateResponse(request, self.get_template(request), {"page": self})
+                return self._response(request)
             raise Http404
 
         if not self.is_approved:
             if request.user.is_authenticated and self.author and self.author.user == request.user:
-                return TemplateResponse(request, self.get_template(request), {"page": self})
+                return self._response(request)
             if request.user.is_staff:
-                return TemplateResponse(request, self.get_template(request), {"page": self})
+                return self._response(request)
             raise Http404
 
-        return TemplateResponse(request, self.get_template(request), {"page": self})
+        return self._response(request)
 
     def is_editable_by(self, user):
         try:
@@ -248,12 +306,6 @@ class BlogPage(Page):
         except AdditionalUserInfo.DoesNotExist:
             return False
 
-    def is_liked_by(self, user):
-        try:
-            return self.likes.filter(author=user.additional_info, is_active=True).exists()
-        except AdditionalUserInfo.DoesNotExist:
-            return False
-
     def get_editor_config(self):
         return {
             "title": self.title,
@@ -273,32 +325,33 @@ class BlogPage(Page):
 
     def get_context(self, request, *args, **kwargs):
         ctx = super().get_context(request, *args, **kwargs)
-        me = getattr(getattr(request, "user", None), "additional_info", None)
-        if me:
-            ctx["following_user_ids"] = list(
-                me.following.filter(is_active=True).values_list("following__user_id", flat=True)
-            )
+        viewer = get_viewer(request)
+        if viewer.profile:
+            ctx["following_user_ids"] = viewer.following_user_ids
         return ctx
 
     @property
     def is_pending(self):
         return self.live and not self.is_deleted and not self.is_approved and not self.is_rejected
 
-    @staticmethod
-    def _plain_text_from_body(body: str) -> str:
-        text = strip_tags(body or "")
-        text = html.unescape(text)
-        return re.sub(r"\s+", " ", text).strip()
+    def refresh_plain_text(self) -> None:
+        self.plain_body = plain_text_from_html(self.body)
+        self.preview = Truncator(self.plain_body).chars(ARTICLE_CARD_PREVIEW_MAX_LENGTH) if self.plain_body else ""
+        self.word_count = len(self.plain_body.split())
 
     def build_intro_from_body(self, max_length: int = ARTICLE_INTRO_MAX_LENGTH) -> str:
-        plain_text = self._plain_text_from_body(self.body)
+        plain_text = self.plain_body or plain_text_from_html(self.body)
         if not plain_text:
             return ""
         return Truncator(plain_text).chars(max_length)
 
     @property
     def preview_text(self) -> str:
-        return self.build_intro_from_body(ARTICLE_CARD_PREVIEW_MAX_LENGTH)
+        return self.preview
+
+    @property
+    def reading_minutes(self) -> int:
+        return max(1, -(-self.word_count // WORDS_PER_MINUTE))
 
 
 class ArticleLike(models.Model):
@@ -325,6 +378,7 @@ class ArticleComment(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["article", "-created_at", "-id"])]
         verbose_name = _("Article comment")
         verbose_name_plural = _("Article comments")
 
@@ -359,3 +413,29 @@ class ArticleSubscriptionSettings(models.Model):
 
     def __str__(self):
         return force_str(f"ArticleSubscriptionSettings for {_safe_username(self.user_info)}")
+
+
+class ArticleNotificationJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        CANCELLED = "cancelled", _("Cancelled")
+
+    article = models.OneToOneField(BlogPage, on_delete=models.CASCADE, related_name="notification_job")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING, db_index=True)
+    url = models.CharField(max_length=500, blank=True)
+    last_subscription_id = models.BigIntegerField(default=0)
+    processed_count = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Article notification job")
+        verbose_name_plural = _("Article notification jobs")
+
+    def __str__(self):
+        return force_str(f"ArticleNotificationJob#{self.pk} article={self.article_id} {self.status}")
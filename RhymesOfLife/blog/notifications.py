@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.translation import gettext as _, override
+
+from base.models import Notification
+from base.utils import notification_cache
+from base.utils.logging import get_app_logger
+from base.utils.notify import enqueue_external_many
+
+from .models import ArticleNotificationJob, ArticleSubscriptionSettings, BlogPage
+
+log = get_app_logger(__name__)
+
+CHUNK_SIZE = int(getattr(settings, "ARTICLE_NOTIFY_CHUNK_SIZE", 200))
+MAX_ATTEMPTS = 5
+
+
+def is_notifiable(page: BlogPage) -> bool:
+    return bool(
+        not page.subscribers_notified_at and page.live and not page.is_deleted
+        and not page.is_hidden and page.is_approved
+    )
+
+
+def enqueue_article_notification(page: BlogPage, url: str) -> ArticleNotificationJob | None:
+    if not is_notifiable(page):
+        return None
+    job, created = ArticleNotificationJob.objects.get_or_create(article=page, defaults={"url": url})
+    if not created and job.status == ArticleNotificationJob.Status.CANCELLED:
+        job.status = ArticleNotificationJob.Status.PENDING
+        job.url = url or job.url
+        job.save(update_fields=["status", "url", "updated_at"])
+    if created:
+        log.info("Article notification job queued: page_id=%s job_id=%s", page.pk, job.pk)
+    return job
+
+
+def _author_name(author) -> str:
+    if not author:
+        return ""
+    parts = [getattr(author, "first_name", "") or "", getattr(author, "last_name", "") or ""]
+    return " ".join(p for p in parts if p).strip() or getattr(getattr(author, "user", None), "username", "")
+
+
+def _localized_texts(page: BlogPage, author_name: str, url: str, language: str) -> dict:
+    with override(language):
+        message = _("A new expert article has just been published: %(title)s") % {"title": page.title}
+        if author_name:
+            message = _("%(message)s Author: %(author)s.") % {"message": message, "author": author_name}
+        email_body = _(
+            "A new expert article has just been published on Rhythms of Life.\n\n"
+            "Title: %(title)s\n"
+            "%(author_line)s"
+            "Open article: %(url)s\n\n"
+            "You are receiving this email because you subscribed to article updates."
+        ) % {
+            "title": page.title,
+            "author_line": (_("Author: %(author)s\n") % {"author": author_name}) if author_name else "",
+            "url": url,
+        }
+        if page.preview:
+            email_body = f"{page.preview}\n\n{email_body}"
+        return {
+            "title": _("New article in Rhythms of Life"),
+            "message": message,
+            "email_subject": _("New article: %(title)s") % {"title": page.title},
+            "email_body": email_body,
+            "button_text": _("Open article"),
+            "url": url,
+        }
+
+
+def _subscriptions(page: BlogPage):
+    qs = (
+        ArticleSubscriptionSettings.objects
+        .select_related("user_info__user", "user_info__telegram_account")
+        .filter(enabled=True)
+        .order_by("id")
+    )
+    author_user_id = getattr(getattr(page, "author", None), "user_id", None)
+    if author_user_id:
+        qs = qs.exclude(user_info__user_id=author_user_id)
+    return qs
+
+
+def _create_site_notifications(page: BlogPage, chunk, texts_for) -> dict[int, Notification]:
+    recipients = [s.user_info for s in chunk if s.site_notifications_enabled]
+    if not recipients:
+        return {}
+    already = set(
+        Notification.objects.filter(
+            recipient__in=recipients,
+            notification_type="ARTICLE_PUBLISHED",
+            payload__article_id=page.pk,
+        ).values_list("recipient_id", flat=True)
+    )
+    rows = []
+    for info in recipients:
+        if info.pk in already:
+            continue
+        texts = texts_for(info)
+        rows.append(Notification(
+            recipient=info,
+            sender=page.author,
+            notification_type="ARTICLE_PUBLISHED",
+            title=texts["title"],
+            message=texts["message"],
+            url=texts["url"],
+            payload={"article_id": page.pk, "skip_telegram": True},
+            source=Notification.Source.SYSTEM,
+            scope=Notification.Scope.PERSONAL,
+        ))
+    Notification.objects.bulk_create(rows, batch_size=500)
+    notification_cache.invalidate(info.pk for info in recipients)
+    return {n.recipient_id: n for n in rows}
+
+
+def _delivery(page: BlogPage, sub, texts, notification: Notification | None) -> dict:
+    return {
+        "recipient": sub.user_info,
+        "notification": notification,
+        "title": texts["title"],
+        "message": texts["message"],
+        "url": texts["url"],
+        "button_text": texts["button_text"],
+        "via_telegram": sub.tg_notifications_enabled,
+        "via_email": sub.email_notifications_enabled,
+        "email_subject": texts["email_subject"],
+        "email_body": texts["email_body"],
+        "dedupe_key": f"article:{page.pk}:{sub.user_info_id}",
+    }
+
+
+def process_job_chunk(job_id: int) -> bool:
+    with transaction.atomic():
+        job = (
+            ArticleNotificationJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(pk=job_id, status__in=[ArticleNotificationJob.Status.PENDING, ArticleNotificationJob.Status.RUNNING])
+            .first()
+        )
+        if job is None:
+            return False
+
+        page = BlogPage.objects.select_related("author__user").filter(pk=job.article_id).first()
+        if page is None or not is_notifiable(page):
+            job.status = ArticleNotificationJob.Status.CANCELLED
+            job.save(update_fields=["status", "updated_at"])
+            return False
+
+        chunk = list(_subscriptions(page).filter(id__gt=job.last_subscription_id)[:CHUNK_SIZE])
+        if not chunk:
+            now = timezone.now()
+            BlogPage.objects.filter(pk=page.pk).update(subscribers_notified_at=now)
+            job.status = ArticleNotificationJob.Status.DONE
+            job.finished_at = now
+            job.save(update_fields=["status", "finished_at", "updated_at"])
+            log.info("Article notification job done: job_id=%s page_id=%s processed=%s", job.pk, page.pk, job.processed_count)
+            return False
+
+        author_name = _author_name(page.author)
+        by_language: dict[str, dict] = {}
+
+        def texts_for(info):
+            language = info.language or "en"
+            if language not in by_language:
+                by_language[language] = _localized_texts(page, author_name, job.url, language)
+            return by_language[language]
+
+        created = _create_site_notifications(page, chunk, texts_for)
+
+        external = [s for s in chunk if s.tg_notifications_enabled or s.email_notifications_enabled]
+        if external:
+            enqueue_external_many([
+                _delivery(page, s, texts_for(s.user_info), created.get(s.user_info_id)) for s in external
+            ])
+
+        job.status = ArticleNotificationJob.Status.RUNNING
+        job.last_subscription_id = chunk[-1].id
+        job.processed_count += len(chunk)
+        job.save(update_fields=["status", "last_subscription_id", "processed_count", "updated_at"])
+    return True
+
+
+def run_pending_jobs(*, logger=None) -> int:
+    logger = logger or log
+    job_ids = list(
+        ArticleNotificationJob.objects
+        .filter(status__in=[ArticleNotificationJob.Status.PENDING, ArticleNotificationJob.Status.RUNNING],
+                attempts__lt=MAX_ATTEMPTS)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    for job_id in job_ids:
+        try:
+            while process_job_chunk(job_id):
+                pass
+        except Exception as e:
+            ArticleNotificationJob.objects.filter(pk=job_id).update(
+                attempts=F("attempts") + 1, last_error=str(e)[:2000], updated_at=timezone.now()
+            )
+            logger.exception("Article notification job failed: job_id=%s", job_id)
+    return len(job_ids)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+CACHE_TTL = int(getattr(settings, "BLOG_PAGE_CACHE_SECONDS", 600))
+INDEX_VERSION_KEY = "blog:page:version:index"
+ARTICLE_VERSION_KEY = "blog:page:version:article:{}"
+
+
+def _version(key: str) -> int:
+    return cache.get_or_set(key, time.time_ns(), None)
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def _bump_now(article_id: int | None) -> None:
+    _bump(INDEX_VERSION_KEY)
+    if article_id:
+        _bump(ARTICLE_VERSION_KEY.format(article_id))
+
+
+def invalidate(article_id: int | None = None) -> None:
+    transaction.on_commit(lambda: _bump_now(article_id))
+
+
+def is_cacheable_request(request) -> bool:
+    user = getattr(request, "user", None)
+    return request.method in ("GET", "HEAD") and not (user and user.is_authenticated)
+
+
+def _cache_key(request, article_id: int | None) -> str:
+    if article_id:
+        version = _version(ARTICLE_VERSION_KEY.format(article_id))
+    else:
+        version = _version(INDEX_VERSION_KEY)
+    variant = "|".join([
+        request.get_full_path(),
+        getattr(request, "LANGUAGE_CODE", "") or "",
+        "xhr" if request.headers.get("x-requested-with") == "XMLHttpRequest" else "",
+    ])
+    digest = hashlib.md5(variant.encode("utf-8")).hexdigest()
+    return f"blog:page:{article_id or 'index'}:{version}:{digest}"
+
+
+def _can_store(request, response) -> bool:
+    session = getattr(request, "session", None)
+    return (
+        response.status_code == 200
+        and not response.cookies
+        and not response.has_header("Set-Cookie")
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and not getattr(session, "modified", False)
+    )
+
+
+def _from_entry(request, entry) -> HttpResponse:
+    response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    response["ETag"] = entry["etag"]
+    response["Last-Modified"] = http_date(entry["last_modified"])
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    patch_vary_headers(response, ("Cookie", "Accept-Language"))
+    return get_conditional_response(
+        request, etag=entry["etag"], last_modified=entry["last_modified"], response=response
+    )
+
+
+def serve_cached(request, render, *, article_id: int | None = None):
+    if not is_cacheable_request(request):
+        return render()
+
+    key = _cache_key(request, article_id)
+    entry = cache.get(key)
+    if entry is None:
+        response = render()
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+        if not _can_store(request, response):
+            return response
+        entry = {
+            "content": response.content,
+            "content_type": response["Content-Type"],
+            "etag": quote_etag(hashlib.md5(response.content).hexdigest()),
+            "last_modified": int(time.time()),
+        }
+        cache.set(key, entry, CACHE_TTL)
+    return _from_entry(request, entry)
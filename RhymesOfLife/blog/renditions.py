@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from django.db.models import Count, Q
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+
+from . import page_cache
+from .constants import ARTICLE_RENDITIONS
+from .models import BlogPage
+
+
+class OriginalImage(NamedTuple):
+    url: str
+    width: int
+    height: int
+
+
+def pending_image_ids(*, limit: int = 50, exclude=()) -> list[int]:
+    ready = Count(
+        "renditions__filter_spec",
+        filter=Q(renditions__filter_spec__in=ARTICLE_RENDITIONS),
+        distinct=True,
+    )
+    return list(
+        get_image_model().objects
+        .filter(pk__in=BlogPage.objects.exclude(main_image=None).values("main_image_id"))
+        .exclude(pk__in=list(exclude))
+        .annotate(ready=ready)
+        .filter(ready__lt=len(ARTICLE_RENDITIONS))
+        .order_by("-id")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+def generate_article_renditions(image_id: int) -> int:
+    image = get_image_model().objects.filter(pk=image_id).first()
+    if image is None:
+        return 0
+    count = len(image.get_renditions(*ARTICLE_RENDITIONS))
+    for article_id in BlogPage.objects.filter(main_image_id=image_id).values_list("pk", flat=True):
+        page_cache.invalidate(article_id)
+    return count
+
+
+def ready_renditions(image, specs) -> list | None:
+    if image is None:
+        return None
+    filters = [Filter(spec=spec) for spec in specs]
+    found = image.find_existing_renditions(*filters)
+    if len(found) < len(filters):
+        original = OriginalImage(image.file.url, image.width, image.height)
+        return [found.get(f, original) for f in filters]
+    return [found[f] for f in filters]
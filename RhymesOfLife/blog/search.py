@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import html
+import re
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat
+from django.utils.html import strip_tags
+
+SEARCH_CONFIGS = ("russian", "english")
+MAX_QUERY_TERMS = 8
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def plain_text_from_html(value: str) -> str:
+    text = html.unescape(strip_tags(value or ""))
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _tag_names(tag_model):
+    return Subquery(
+        tag_model.objects.filter(content_object_id=OuterRef("pk"))
+        .order_by()
+        .values("content_object_id")
+        .annotate(names=StringAgg("tag__name", " "))
+        .values("names")[:1]
+    )
+
+
+def _author_name():
+    return Concat(
+        Coalesce(F("author__first_name"), Value("")),
+        Value(" "),
+        Coalesce(F("author__last_name"), Value("")),
+        output_field=TextField(),
+    )
+
+
+def build_search_vector(tag_model, body=None):
+    body = body if body is not None else F("plain_body")
+    vector = SearchVector(_tag_names(tag_model), _author_name(), weight="B", config="simple")
+    for config in SEARCH_CONFIGS:
+        vector = (
+            vector
+            + SearchVector("title", weight="A", config=config)
+            + SearchVector("intro", weight="B", config=config)
+            + SearchVector(body, weight="C", config=config)
+        )
+    return vector
+
+
+def refresh_search_vectors(queryset, tag_model, body=None) -> int:
+    model = queryset.model
+    computed = (
+        model.objects.filter(pk=OuterRef("pk"))
+        .annotate(vector=build_search_vector(tag_model, body))
+        .values("vector")[:1]
+    )
+    return model.objects.filter(pk__in=queryset.values("pk")).update(search_vector=Subquery(computed))
+
+
+def build_search_query(text: str) -> SearchQuery | None:
+    terms = TERM_RE.findall(text or "")[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    raw = " & ".join(f"{term}:*" for term in terms)
+    query = SearchQuery(raw, search_type="raw", config="simple")
+    for config in SEARCH_CONFIGS:
+        query |= SearchQuery(raw, search_type="raw", config=config)
+    return query
+
+
+def apply_search(queryset, text: str):
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+    )
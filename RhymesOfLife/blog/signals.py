@@ -0,0 +1,47 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import Site
+from wagtail.signals import page_slug_changed, post_page_move
+
+from base.models import AdditionalUserInfo
+from base.utils.counter_buffer import counters_flushed
+from base.utils.logging import get_app_logger
+
+from . import blog_index, page_cache
+from .models import BlogIndexPage, BlogPage, BlogPageTag
+from .search import refresh_search_vectors
+
+log = get_app_logger(__name__)
+
+AUTHOR_NAME_FIELDS = frozenset({"first_name", "last_name"})
+
+
+@receiver(post_save, sender=AdditionalUserInfo, dispatch_uid="refresh_article_search_on_author_rename")
+def refresh_article_search_on_author_rename(sender, instance: AdditionalUserInfo, created: bool, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not AUTHOR_NAME_FIELDS.intersection(update_fields)):
+        return
+    try:
+        refresh_search_vectors(BlogPage.objects.filter(author=instance), BlogPageTag)
+    except Exception:
+        log.exception("Article search refresh failed: author_id=%s", instance.pk)
+
+
+@receiver(counters_flushed, sender=BlogPage, dispatch_uid="drop_article_page_cache_on_counter_flush")
+def drop_article_page_cache_on_counter_flush(sender, pks, **kwargs):
+    for pk in pks:
+        page_cache.invalidate(pk)
+
+
+@receiver(post_delete, sender=BlogPage, dispatch_uid="drop_article_page_cache")
+def drop_article_page_cache(sender, instance: BlogPage, **kwargs):
+    page_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=BlogIndexPage, dispatch_uid="reset_blog_index_on_save")
+@receiver(post_delete, sender=BlogIndexPage, dispatch_uid="reset_blog_index_on_delete")
+@receiver(post_save, sender=Site, dispatch_uid="reset_blog_index_on_site_save")
+@receiver(post_delete, sender=Site, dispatch_uid="reset_blog_index_on_site_delete")
+@receiver(post_page_move, dispatch_uid="reset_blog_index_on_page_move")
+@receiver(page_slug_changed, dispatch_uid="reset_blog_index_on_slug_change")
+def reset_blog_index(sender, **kwargs):
+    blog_index.invalidate()
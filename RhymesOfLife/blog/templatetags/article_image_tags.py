@@ -0,0 +1,10 @@
+from django import template
+
+from blog.renditions import ready_renditions as _ready_renditions
+
+register = template.Library()
+
+
+@register.simple_tag
+def ready_renditions(image, *specs):
+    return _ready_renditions(image, specs)
@@ -3,7 +3,7 @@ from wagtail.images import urls as wagtailimages_urls
 from .views import (
     create_article_view, edit_article_view, delete_article_view,
     hide_article_view, unhide_article_view,
-    like_article_view, comment_article_view, ajax_article_search,
+    like_article_view, comment_article_view, article_comments_view, ajax_article_search,
     delete_comment_view, edit_comment_view, ckeditor5_upload,
     approve_article_view,
     reject_article_view,
@@ -19,6 +19,7 @@ urlpatterns = [
 
     path('<int:page_id>/like/', like_article_view, name='like_article'),
     path('<int:page_id>/comment/', comment_article_view, name='comment_article'),
+    path('<int:page_id>/comments/', article_comments_view, name='article_comments'),
     path('comment/<int:comment_id>/delete/', delete_comment_view, name='delete_comment'),
     path('comment/<int:comment_id>/edit/', edit_comment_view, name='edit_comment'),
 
@@ -1,17 +1,17 @@
 from django.conf import settings
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.core.exceptions import ValidationError, RequestDataTooBig
-from django.http import JsonResponse, HttpResponseForbidden
+from django.http import Http404, JsonResponse, HttpResponseForbidden
 from django.shortcuts import render, redirect, get_object_or_404
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.text import slugify
-from django.utils.translation import gettext as _, override
+from django.utils.text import Truncator, slugify
+from django.utils.translation import gettext as _
 from django.views.decorators.http import require_http_methods, require_POST
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import Q
-from django.core.paginator import Paginator, EmptyPage
+from django.core.paginator import Paginator
 
 from wagtail.models import Page, Site
 from wagtail.images import get_image_model
@@ -25,12 +25,20 @@ from .models import (
     ARTICLE_INTRO_MAX_LENGTH,
     user_can_manage_articles,
 )
-from .constants import PREDEFINED_TAGS
-
+from . import page_cache
+from .blog_index import get_blog_index
+from .constants import COMMENTS_PAGE_MAX, COMMENTS_PAGE_SIZE, PREDEFINED_TAGS
+from .listing import paginate_cards
+from .notifications import enqueue_article_notification
+from .search import plain_text_from_html
+
+from base.utils import counter_buffer
+from base.utils.avatars import avatar_urls
+from base.utils.counters import apply_delta, mark_flag, toggle_active
 from base.utils.files import validate_image_upload
 from base.utils.html import sanitize_html
 from base.utils.logging import get_app_logger
-from base.utils.notify import send_notification_multichannel
+from base.utils.pagination import keyset_page
 
 from PIL import Image as PILImage, ImageFile
 ImageFile.LOAD_TRUNCATED_IMAGES = False
@@ -46,6 +54,8 @@ ALLOWED_IMAGE_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
 article_author_required = user_passes_test(user_can_manage_articles)
 staff_required = user_passes_test(lambda u: (u.is_staff or u.is_superuser))
 
+SLUG_ALLOCATION_ATTEMPTS = 3
+
 
 def _request_too_large_message() -> str:
     max_mb = int(getattr(settings, "DATA_UPLOAD_MAX_MEMORY_SIZE", 0) or 0) // (1024 * 1024)
@@ -58,7 +68,10 @@ def _request_too_large_message() -> str:
 
 def _get_or_create_blog_index():
     root = Page.get_first_root_node()
-    parent = BlogIndexPage.objects.first()
+    cached = get_blog_index()
+    parent = BlogIndexPage.objects.filter(pk=cached.pk).first() if cached else None
+    if parent is None:
+        parent = BlogIndexPage.objects.first()
     if not parent:
         parent = BlogIndexPage(title="Blog", slug="blog")
         root.add_child(instance=parent)
@@ -90,15 +103,37 @@ def _latest_revision_specific(page):
         return page
 
 
-def _unique_slug(base: str) -> str:
+def _unique_slug(parent: Page, base: str) -> str:
     if not base:
         base = str(int(timezone.now().timestamp()))
-    slug = base
+    with connection.cursor() as c:
+        c.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [f"blog-slug:{parent.pk}:{base}"])
+
+    taken = set(
+        parent.get_children()
+        .filter(Q(slug=base) | Q(slug__startswith=f"{base}-"))
+        .values_list("slug", flat=True)
+    )
+    if base not in taken:
+        return base
+    suffixes = {int(s[len(base) + 1:]) for s in taken if s[len(base) + 1:].isdigit()}
     i = 1
-    while BlogPage.objects.filter(slug=slug).exists():
-        slug = f"{base}-{i}"
+    while i in suffixes:
         i += 1
-    return slug
+    return f"{base}-{i}"
+
+
+def _add_article_page(parent: Page, page: BlogPage, base_slug: str) -> None:
+    for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+        page.slug = _unique_slug(parent, base_slug)
+        try:
+            with transaction.atomic():
+                parent.add_child(instance=page)
+            return
+        except ValidationError as e:
+            if "slug" not in getattr(e, "message_dict", {}) or attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                raise
+            log.warning("Article slug conflict, retrying: slug=%s attempt=%s", page.slug, attempt + 1)
 
 
 def _filter_tags_to_predefined(tags):
@@ -135,73 +170,10 @@ def _my_articles_url() -> str:
     return "/articles/?filter=mine"
 
 
-def _article_subscriptions_qs(*, exclude_user_id: int | None = None):
-    qs = (
-        ArticleSubscriptionSettings.objects
-        .select_related("user_info__user", "user_info__telegram_account")
-        .filter(enabled=True)
-    )
-    if exclude_user_id:
-        qs = qs.exclude(user_info__user_id=exclude_user_id)
-    return qs
-
-
 def _notify_article_subscribers(page: BlogPage, request=None) -> bool:
-    if page.subscribers_notified_at or not page.live or page.is_deleted or page.is_hidden or not page.is_approved:
-        return False
-
     relative_url = _article_public_url(page, request)
     absolute_url = request.build_absolute_uri(relative_url) if request else relative_url
-    author = getattr(page, "author", None)
-    author_name = ""
-    if author:
-        author_name = " ".join(
-            p for p in [getattr(author, "first_name", "") or "", getattr(author, "last_name", "") or ""] if p
-        ).strip() or getattr(getattr(author, "user", None), "username", "")
-
-    sent_any = False
-    for settings_obj in _article_subscriptions_qs(exclude_user_id=getattr(getattr(author, "user", None), "id", None)):
-        recipient = settings_obj.user_info
-        with override(recipient.language or "en"):
-            title = _("New article in Rhythms of Life")
-            message = _("A new expert article has just been published: %(title)s") % {"title": page.title}
-            if author_name:
-                message = _("%(message)s Author: %(author)s.") % {"message": message, "author": author_name}
-
-            email_subject = _("New article: %(title)s") % {"title": page.title}
-            email_body = _(
-                "A new expert article has just been published on Rhythms of Life.\n\n"
-                "Title: %(title)s\n"
-                "%(author_line)s"
-                "Open article: %(url)s\n\n"
-                "You are receiving this email because you subscribed to article updates."
-            ) % {
-                "title": page.title,
-                "author_line": (_("Author: %(author)s\n") % {"author": author_name}) if author_name else "",
-                "url": absolute_url,
-            }
-            button_text = _("Open article")
-
-        result = send_notification_multichannel(
-            recipient=recipient,
-            sender=author,
-            notification_type="ARTICLE_PUBLISHED",
-            title=title,
-            message=message,
-            url=absolute_url,
-            button_text=button_text,
-            payload={"article_id": page.id},
-            via_site=settings_obj.site_notifications_enabled,
-            via_telegram=settings_obj.tg_notifications_enabled,
-            via_email=settings_obj.email_notifications_enabled,
-            email_subject=email_subject,
-            email_body=email_body,
-        )
-        sent_any = sent_any or bool(result.get("notification_id") or result.get("telegram_sent") or result.get("email_sent"))
-
-    page.subscribers_notified_at = timezone.now()
-    page.save(update_fields=["subscribers_notified_at"])
-    return sent_any
+    return enqueue_article_notification(page, absolute_url) is not None
 
 
 def _save_article_visibility(page, *, hidden: bool) -> None:
@@ -212,8 +184,8 @@ def _save_article_visibility(page, *, hidden: bool) -> None:
 
 
 def _build_article_intro(body: str) -> str:
-    probe = BlogPage(body=body)
-    return probe.build_intro_from_body(ARTICLE_INTRO_MAX_LENGTH)
+    plain_text = plain_text_from_html(body)
+    return Truncator(plain_text).chars(ARTICLE_INTRO_MAX_LENGTH) if plain_text else ""
 
 
 @login_required
@@ -257,11 +229,9 @@ def create_article_view(request):
                     )
 
                 parent = _get_or_create_blog_index()
-                unique_slug = _unique_slug(slugify(title, allow_unicode=True))
 
                 page = BlogPage(
                     title=title,
-                    slug=unique_slug,
                     date=timezone.now(),
                     intro=intro,
                     author=request.user.additional_info,
@@ -275,7 +245,7 @@ def create_article_view(request):
                     page.is_rejected = False
                     page.rejected_at = None
                     page.rejected_by = None
-                parent.add_child(instance=page)
+                _add_article_page(parent, page, slugify(title, allow_unicode=True))
                 if tags:
                     page.tags.add(*tags)
                 rev = page.save_revision()
@@ -436,12 +406,10 @@ def like_article_view(request, page_id):
     like, created = ArticleLike.objects.get_or_create(
         author=user_info, article=page, defaults={"is_active": True}
     )
-    if not created:
-        like.is_active = not like.is_active
-        like.save(update_fields=["is_active"])
-
-    page.likes_count = ArticleLike.objects.filter(article=page, is_active=True).count()
-    page.save(update_fields=["likes_count"])
+    delta = 1 if created else toggle_active(like)
+    page.likes_count = counter_buffer.bump(BlogPage, page.pk, "likes_count", delta, current=page.likes_count)
+    if not counter_buffer.enabled():
+        page_cache.invalidate(page.pk)
 
     log.info("Article like toggled: page_id=%s user_id=%s liked=%s", page.id, request.user.id, like.is_active)
     return JsonResponse({"liked": like.is_active, "like_count": page.likes_count})
@@ -458,9 +426,8 @@ def comment_article_view(request, page_id):
     user_info = request.user.additional_info
 
     comment = ArticleComment.objects.create(article=page, author=user_info, text=text)
-
-    page.comments_count = ArticleComment.objects.filter(article=page, is_deleted=False).count()
-    page.save(update_fields=["comments_count"])
+    page.comments_count = apply_delta(BlogPage, page.pk, "comments_count", 1)
+    page_cache.invalidate(page.pk)
 
     log.info("Article comment added: page_id=%s user_id=%s comment_id=%s", page.id, request.user.id, comment.id)
     return JsonResponse({
@@ -473,22 +440,60 @@ def comment_article_view(request, page_id):
     })
 
 
+def _can_view_article(page, user) -> bool:
+    if page.live and not page.is_hidden and page.is_approved:
+        return True
+    if not user.is_authenticated:
+        return False
+    return user.is_staff or bool(page.author and page.author.user_id == user.id)
+
+
+def _serialize_article_comment(comment, user, avatars) -> dict:
+    info = comment.author
+    return {
+        "id": comment.id,
+        "username": info.first_name or info.user.username,
+        "avatar": avatars.get(info.pk, ""),
+        "text": comment.text,
+        "created_at": timezone.localtime(comment.created_at).strftime("%d.%m.%Y %H:%M"),
+        "edited": comment.edited_at is not None,
+        "can_edit": user.is_authenticated and (info.user_id == user.id or user.is_superuser),
+    }
+
+
+@require_http_methods(["GET"])
+def article_comments_view(request, page_id):
+    page = get_object_or_404(BlogPage.objects.select_related("author"), id=page_id, is_deleted=False)
+    if not _can_view_article(page, request.user):
+        raise Http404
+
+    try:
+        limit = int(request.GET.get("limit", COMMENTS_PAGE_SIZE))
+    except ValueError:
+        limit = COMMENTS_PAGE_SIZE
+    limit = max(1, min(limit, COMMENTS_PAGE_MAX))
+
+    qs = ArticleComment.objects.filter(article_id=page.pk, is_deleted=False).select_related("author__user")
+    comments, next_cursor = keyset_page(qs, request.GET.get("cursor"), limit=limit)
+
+    avatars = avatar_urls(c.author for c in comments)
+    items = [_serialize_article_comment(c, request.user, avatars) for c in comments]
+    return JsonResponse({"items": items, "has_more": next_cursor is not None, "next_cursor": next_cursor})
+
+
 def ajax_article_search(request):
     query = request.GET.get("q", "").strip()
     sort = request.GET.get("sort", "date").strip()
     current_filter = request.GET.get("filter", "").strip()
     page_num = request.GET.get("page", "1")
-    blog_index = BlogIndexPage.objects.first()
+    blog_index = get_blog_index()
 
     results = BlogPage.objects.none()
     if blog_index:
         results, current_filter, sort, query = blog_index._base_context_queryset(request)
 
     paginator = Paginator(results, 10)
-    try:
-        page_obj = paginator.page(page_num)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
+    page_obj = paginate_cards(paginator, page_num, request)
 
     html = render_to_string(
         "blog/includes/article_list_fragment.html",
@@ -568,15 +573,12 @@ def delete_comment_view(request, comment_id):
     if comment.author.user != request.user and not request.user.is_superuser:
         return HttpResponseForbidden(_("You cannot delete someone else's comment."))
 
-    comment.is_deleted = True
-    comment.save(update_fields=["is_deleted"])
-
-    article = comment.article
-    article.comments_count = ArticleComment.objects.filter(article=article, is_deleted=False).count()
-    article.save(update_fields=["comments_count"])
+    delta = -1 if mark_flag(comment, "is_deleted") else 0
+    comment_count = apply_delta(BlogPage, comment.article_id, "comments_count", delta)
+    page_cache.invalidate(comment.article_id)
 
     log.info("Article comment deleted: comment_id=%s user_id=%s", comment.id, request.user.id)
-    return JsonResponse({"deleted": True, "comment_count": article.comments_count})
+    return JsonResponse({"deleted": True, "comment_count": comment_count})
 
 
 @login_required
@@ -593,6 +595,7 @@ def edit_comment_view(request, comment_id):
     comment.text = new_text
     comment.edited_at = timezone.now()
     comment.save(update_fields=["text", "edited_at"])
+    page_cache.invalidate(comment.article_id)
 
     log.info("Article comment edited: comment_id=%s user_id=%s", comment.id, request.user.id)
     return JsonResponse({"text": comment.text, "edited_at": comment.edited_at.strftime("%Y-%m-%d %H:%M")})
@@ -107,6 +107,10 @@ function getCookie(name){
         return;
       }
       const j = await r.json();
+      if(j.status_url){
+        pollBroadcast(j.status_url, j);
+        return;
+      }
       let text = '';
       if(j.id) text = (typeof gettext==='function'? gettext('Notification sent. ID: ') : 'Notification sent. ID: ') + j.id;
       else if(j.sent != null) {
@@ -124,6 +128,41 @@ function getCookie(name){
     }
   }
 
+  function broadcastText(j){
+    const p1 = (typeof gettext==='function'? gettext('Broadcast sent to ') : 'Broadcast sent to ');
+    const p2 = (typeof gettext==='function'? gettext(' users') : ' users');
+    return p1 + j.processed + ' / ' + j.total + p2;
+  }
+
+  function showBroadcast(j){
+    let cls = 'alert-info';
+    if(j.status === 'done') cls = 'alert-success';
+    else if(j.status === 'failed') cls = 'alert-danger';
+    const pct = j.total ? Math.min(100, Math.round(j.processed * 100 / j.total)) : 100;
+    result.innerHTML =
+      '<div class="alert '+ cls +'" role="status">'+ broadcastText(j) +
+      '<div class="progress mt-2" role="progressbar" aria-valuenow="'+ pct +'" aria-valuemin="0" aria-valuemax="100">' +
+      '<div class="progress-bar" style="width:'+ pct +'%"></div></div></div>';
+  }
+
+  async function pollBroadcast(url, j){
+    showBroadcast(j);
+    while(!j.finished){
+      await new Promise(res => setTimeout(res, 2000));
+      try{
+        const r = await fetch(url, {
+          credentials: 'same-origin',
+          headers: { 'X-Requested-With': 'XMLHttpRequest', 'Accept': 'application/json' }
+        });
+        if(!r.ok) continue;
+        j = await r.json();
+        showBroadcast(j);
+      }catch(e){
+        // transient network errors: keep polling
+      }
+    }
+  }
+
   function onUnameInput(){
     const v = unameEl.value.trim();
     syncPickedUser();
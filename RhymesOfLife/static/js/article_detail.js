@@ -265,6 +265,71 @@ document.addEventListener('DOMContentLoaded', () => {
     });
   }
 
+  const moreBtn = document.getElementById('comments-more');
+
+  function loadedCommentHtml(c) {
+    const avatarLabel = moreBtn?.dataset?.avatarLabel || '';
+    const editedLabel = moreBtn?.dataset?.editedLabel || '';
+    return `
+      <div class="rl-comment" data-comment-id="${escapeHtml(c.id)}">
+        <div class="rl-comment__head">
+          ${c.avatar ? `<img src="${escapeHtml(c.avatar)}" class="rl-comment__avatar" width="34" height="34" alt="${escapeHtml(avatarLabel)}">` : ''}
+          <div class="d-flex flex-column">
+            <span class="rl-comment__name">${escapeHtml(c.username || '')}</span>
+            <span class="rl-comment__time">${escapeHtml(c.created_at || '')}${c.edited ? ` (${escapeHtml(editedLabel)})` : ''}</span>
+          </div>
+          ${c.can_edit ? `
+          <div class="rl-comment__actions">
+            <button class="btn btn-sm btn-outline-secondary edit-comment-btn" type="button" aria-label="${escapeHtml(gettext('Edit'))}">
+              <i class="bi bi-pencil" aria-hidden="true"></i>
+            </button>
+            <button class="btn btn-sm btn-outline-danger delete-comment-btn" type="button" aria-label="${escapeHtml(gettext('Delete'))}">
+              <i class="bi bi-trash" aria-hidden="true"></i>
+            </button>
+          </div>` : ''}
+        </div>
+        <p class="rl-comment__text comment-text text-break">${escapeHtml(c.text || '').replaceAll('\n', '<br>')}</p>
+      </div>
+    `.trim();
+  }
+
+  if (moreBtn && commentsDiv) {
+    moreBtn.addEventListener('click', async () => {
+      const url = moreBtn.dataset.url;
+      if (!url) return;
+
+      const qs = new URLSearchParams({ limit: moreBtn.dataset.limit || '10' });
+      if (moreBtn.dataset.cursor) qs.set('cursor', moreBtn.dataset.cursor);
+
+      moreBtn.disabled = true;
+      try {
+        const r = await fetch(`${url}?${qs.toString()}`, {
+          headers: jsonHeaders(),
+          credentials: 'same-origin',
+        });
+        if (!r.ok) return;
+        const d = await r.json();
+
+        const seen = new Set(Array.from(commentsDiv.querySelectorAll('[data-comment-id]')).map((el) => el.dataset.commentId));
+        const html = (d.items || [])
+          .filter((c) => !seen.has(String(c.id)))
+          .map(loadedCommentHtml)
+          .join('');
+        if (html) {
+          removePlaceholder();
+          commentsDiv.insertAdjacentHTML('beforeend', html);
+          attachCommentHandlers();
+        }
+
+        if (d.has_more && d.next_cursor) moreBtn.dataset.cursor = d.next_cursor;
+        else moreBtn.remove();
+      } catch {
+      } finally {
+        moreBtn.disabled = false;
+      }
+    });
+  }
+
   if (csrftoken && commentsDiv && commentForm) {
     commentForm.addEventListener('submit', async (e) => {
       e.preventDefault();
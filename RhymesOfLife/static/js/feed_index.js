@@ -46,7 +46,7 @@ function attachTabs() {
       if (nav) nav.querySelectorAll('.nav-link').forEach((l) => l.classList.remove('active'));
       a.classList.add('active');
 
-      ajaxLoad({ filter: f, page: 1 });
+      ajaxLoad({ filter: f, page: null, cursor: null });
     });
   });
 }
@@ -57,8 +57,7 @@ function attachPagination() {
       e.preventDefault();
       const url = new URL(a.getAttribute('href'), window.location.origin);
       const f = url.searchParams.get('filter') || document.getElementById('current-filter').value;
-      const p = url.searchParams.get('page') || 1;
-      ajaxLoad({ filter: f, page: p });
+      ajaxLoad({ filter: f, page: url.searchParams.get('page'), cursor: url.searchParams.get('cursor') });
     });
   });
 }
@@ -101,7 +100,7 @@ function bindModerationSwitch() {
       } catch (_) {}
     }
 
-    ajaxLoad({ filter: document.getElementById('current-filter').value, page: 1 });
+    ajaxLoad({ filter: document.getElementById('current-filter').value, page: null, cursor: null });
   });
 }
 
@@ -132,13 +131,13 @@ document.addEventListener('DOMContentLoaded', () => {
 
   document.addEventListener('follow:changed', () => {
     const f = document.getElementById('current-filter').value;
-    if (f === 'subscriptions') ajaxLoad({ filter: f, page: 1 });
+    if (f === 'subscriptions') ajaxLoad({ filter: f, page: null, cursor: null });
   });
 
   document.addEventListener('post:updated', (e) => {
     const f = document.getElementById('current-filter').value;
     if (['mine','latest','pending','subscriptions'].includes(f)) {
-      ajaxLoad({ filter: f, page: 1 });
+      ajaxLoad({ filter: f, page: null, cursor: null });
     }
     if (e.detail && e.detail.message) toast(e.detail.message, 'success');
   });
@@ -146,7 +145,7 @@ document.addEventListener('DOMContentLoaded', () => {
   document.addEventListener('post:created', (e) => {
     const f = document.getElementById('current-filter').value;
     if (f === 'mine' || f === 'latest') {
-      ajaxLoad({ filter: f, page: 1 });
+      ajaxLoad({ filter: f, page: null, cursor: null });
     }
     if (e.detail && e.detail.message) toast(e.detail.message, e.detail.approved ? 'success' : 'warning');
   });
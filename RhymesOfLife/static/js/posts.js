@@ -351,7 +351,7 @@ async function refreshCommentsList(postId, limitHint) {
     limitHint || ul.children.length || 0
   );
   try {
-    const qs = new URLSearchParams({ offset: '0', limit: String(limit) });
+    const qs = new URLSearchParams({ limit: String(limit) });
     const r = await fetch(`/posts/${postId}/comments/?${qs.toString()}`, {
       headers: { 'X-Requested-With': 'XMLHttpRequest', 'Accept': 'application/json' }
     });
@@ -362,6 +362,11 @@ async function refreshCommentsList(postId, limitHint) {
     const frag = document.createDocumentFragment();
     data.items.forEach((item) => frag.appendChild(renderCommentItem({ ...item, post: Number(postId) })));
     ul.appendChild(frag);
+    const moreBtn = document.querySelector(`[data-comments-more][data-post-id="${postId}"]`);
+    if (moreBtn) {
+      if (data.has_more && data.next_cursor) moreBtn.dataset.cursor = data.next_cursor;
+      else moreBtn.remove();
+    }
     return true;
   } catch (err) {
     console.error('Failed to refresh comments', err);
@@ -489,10 +494,10 @@ window.initCommentForms = initCommentForms;
 
     const postId = btn.dataset.postId;
     const url = btn.dataset.url || `/posts/${postId}/comments/`;
-    const offset = parseInt(btn.dataset.offset || '0', 10);
     const limit = parseInt(btn.dataset.limit || '10', 10);
 
-    const qs = new URLSearchParams({ offset: String(offset), limit: String(limit) });
+    const qs = new URLSearchParams({ limit: String(limit) });
+    if (btn.dataset.cursor) qs.set('cursor', btn.dataset.cursor);
     const r = await fetch(`${url}?${qs.toString()}`, {
       headers: { 'X-Requested-With': 'XMLHttpRequest', 'Accept': 'application/json' }
     });
@@ -508,8 +513,8 @@ window.initCommentForms = initCommentForms;
       ul.appendChild(frag);
     }
 
-    if (data.has_more) {
-      btn.dataset.offset = String(data.next_offset || offset + limit);
+    if (data.has_more && data.next_cursor) {
+      btn.dataset.cursor = data.next_cursor;
     } else {
       btn.remove();
     }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.utils import formataddr, parseaddr
 from urllib.parse import urljoin
 
@@ -10,6 +12,13 @@ from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+_postbox_clients: dict[tuple, object] = {}
+_postbox_lock = threading.Lock()
+
+
+def _send_workers() -> int:
+    return max(int(getattr(settings, "POSTBOX_SEND_WORKERS", 8) or 1), 1)
+
 
 class EmailVerificationSender:
     PROVIDERS = {
@@ -62,6 +71,9 @@ class EmailVerificationSender:
         return formataddr(("Ритмы жизни", email_address))
 
     def send_verification(self, info):
+        return self.send_email(self.verification_payload(info))
+
+    def verification_payload(self, info) -> dict:
         user = info.user
         self.logger.info("email.verify.prepare user_id=%s email=%s", user.id, getattr(user, "email", None))
         verify_link = self.generate_verification_link(info)
@@ -82,14 +94,13 @@ class EmailVerificationSender:
         text = render_to_string("emails/verify_email.txt", context)
         html = render_to_string("emails/verify_email.html", context)
 
-        payload = {
+        return {
             "to": user.email,
             "subject": subject,
             "text": text,
             "html": html,
             "from_email": self._verification_from_email(),
         }
-        return self.send_email(payload)
 
     def send_email(self, payload: dict):
         method_name = self.PROVIDERS.get(self.provider)
@@ -104,7 +115,18 @@ class EmailVerificationSender:
         )
         return getattr(self, method_name)(payload)
 
-    def _send_via_smtp(self, payload: dict):
+    def send_emails(self, payloads: list[dict]) -> list[bool]:
+        if self.provider not in self.PROVIDERS:
+            raise ValueError("Unsupported email provider")
+        payloads = list(payloads)
+        if not payloads:
+            return []
+        self.logger.info("email.send.batch provider=%s count=%s", self.provider, len(payloads))
+        if self.provider == "smtp":
+            return self._send_batch_via_smtp(payloads)
+        return self._send_batch_via_postbox_api(payloads)
+
+    def _smtp_message(self, payload: dict, connection=None):
         from django.core.mail import EmailMultiAlternatives
 
         from_email = (
@@ -118,16 +140,60 @@ class EmailVerificationSender:
             str(payload.get("text") or ""),
             from_email,
             [str(payload.get("to") or "")],
+            connection=connection,
         )
 
         if payload.get("html"):
             msg.attach_alternative(str(payload["html"]), "text/html")
+        return msg
 
-        msg.send(fail_silently=False)
+    def _send_via_smtp(self, payload: dict):
+        self._smtp_message(payload).send(fail_silently=False)
         self.logger.info("email.sent.smtp to=%s", payload.get("to"))
         return True
 
+    def _send_batch_via_smtp(self, payloads: list[dict]) -> list[bool]:
+        from django.core.mail import get_connection
+
+        results = []
+        with get_connection(fail_silently=False) as connection:
+            for payload in payloads:
+                try:
+                    sent = connection.send_messages([self._smtp_message(payload, connection)])
+                    results.append(bool(sent))
+                    self.logger.info("email.sent.smtp to=%s", payload.get("to"))
+                except Exception as exc:
+                    self.logger.exception("email.smtp.error to=%s error=%s", payload.get("to"), exc)
+                    results.append(False)
+        return results
+
+    def _send_batch_via_postbox_api(self, payloads: list[dict]) -> list[bool]:
+        def _send(payload: dict) -> bool:
+            try:
+                return bool(self._send_via_postbox_api(payload))
+            except Exception as exc:
+                self.logger.exception("postbox.send.error to=%s error=%s", payload.get("to"), exc)
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(_send_workers(), len(payloads))) as pool:
+            return list(pool.map(_send, payloads))
+
     def _postbox_client(self):
+        access_key = getattr(settings, "POSTBOX_ACCESS_KEY_ID", None)
+        secret_key = getattr(settings, "POSTBOX_SECRET_ACCESS_KEY", None)
+        region = getattr(settings, "POSTBOX_REGION", None) or "ru-central1"
+        endpoint = getattr(settings, "POSTBOX_ENDPOINT", None) or "https://postbox.cloud.yandex.net"
+        key = (region, endpoint, access_key, secret_key)
+
+        client = _postbox_clients.get(key)
+        if client is None:
+            with _postbox_lock:
+                client = _postbox_clients.get(key)
+                if client is None:
+                    client = _postbox_clients[key] = self._build_postbox_client()
+        return client
+
+    def _build_postbox_client(self):
         try:
             import boto3
             from botocore.config import Config
@@ -157,6 +223,7 @@ class EmailVerificationSender:
             retries={"max_attempts": 5, "mode": "standard"},
             connect_timeout=10,
             read_timeout=20,
+            max_pool_connections=max(_send_workers(), 10),
         )
 
         return boto3.client(
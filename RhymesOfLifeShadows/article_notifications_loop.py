@@ -0,0 +1,33 @@
+import time
+import signal
+
+from orm_connector import settings  # noqa: F401
+
+from RhymesOfLifeShadows.create_log import create_log
+from blog.notifications import run_pending_jobs
+
+log = create_log("article_notifications.log", "ArticleNotifications")
+
+
+def shutdown_handler(signum, frame):
+    log.info("shutdown")
+    raise SystemExit
+
+
+def main():
+    signal.signal(signal.SIGINT, shutdown_handler)
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    log.info("start article notifications")
+    while True:
+        try:
+            run_pending_jobs(logger=log)
+            time.sleep(5)
+        except SystemExit:
+            break
+        except Exception as e:
+            log.exception(e)
+            time.sleep(30)
+
+
+if __name__ == "__main__":
+    main()
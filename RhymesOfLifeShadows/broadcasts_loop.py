@@ -0,0 +1,33 @@
+import time
+import signal
+
+from orm_connector import settings  # noqa: F401
+
+from RhymesOfLifeShadows.create_log import create_log
+from base.utils.broadcasts import run_pending_broadcasts
+
+log = create_log("broadcasts.log", "Broadcasts")
+
+
+def shutdown_handler(signum, frame):
+    log.info("shutdown")
+    raise SystemExit
+
+
+def main():
+    signal.signal(signal.SIGINT, shutdown_handler)
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    log.info("start broadcasts")
+    while True:
+        try:
+            run_pending_broadcasts(logger=log)
+            time.sleep(5)
+        except SystemExit:
+            break
+        except Exception as e:
+            log.exception(e)
+            time.sleep(30)
+
+
+if __name__ == "__main__":
+    main()
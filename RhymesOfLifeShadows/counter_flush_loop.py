@@ -0,0 +1,40 @@
+import time
+import signal
+
+from orm_connector import settings  # noqa: F401
+
+from django.conf import settings as dj_settings
+
+from RhymesOfLifeShadows.create_log import create_log
+from base.utils import counter_buffer
+
+log = create_log("counter_flush.log", "CounterFlush")
+
+
+def shutdown_handler(signum, frame):
+    log.info("shutdown")
+    raise SystemExit
+
+
+def main():
+    signal.signal(signal.SIGINT, shutdown_handler)
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    interval = max(1, int(getattr(dj_settings, "COUNTER_FLUSH_INTERVAL_SECONDS", 5)))
+    log.info("start counter flush interval=%ss", interval)
+    while True:
+        try:
+            counter_buffer.flush()
+            time.sleep(interval)
+        except SystemExit:
+            try:
+                counter_buffer.flush()
+            except Exception as e:
+                log.exception(e)
+            break
+        except Exception as e:
+            log.exception(e)
+            time.sleep(30)
+
+
+if __name__ == "__main__":
+    main()
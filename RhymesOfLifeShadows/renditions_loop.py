@@ -0,0 +1,59 @@
+import time
+import signal
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from orm_connector import settings  # noqa: F401
+
+from django.conf import settings as dj_settings
+from django.db import close_old_connections
+
+from RhymesOfLifeShadows.create_log import create_log
+from blog.renditions import generate_article_renditions, pending_image_ids
+
+log = create_log("renditions.log", "Renditions")
+
+RETRY_AFTER_SECONDS = 600
+
+
+def shutdown_handler(signum, frame):
+    log.info("shutdown")
+    raise SystemExit
+
+
+def render_image(image_id):
+    close_old_connections()
+    return generate_article_renditions(image_id)
+
+
+def main():
+    signal.signal(signal.SIGINT, shutdown_handler)
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    workers = max(1, int(getattr(dj_settings, "RENDITION_WORKERS", 2)))
+    interval = max(1, int(getattr(dj_settings, "RENDITION_POLL_INTERVAL_SECONDS", 3)))
+    failed = {}
+    log.info("start renditions workers=%s interval=%ss", workers, interval)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        while True:
+            try:
+                now = time.monotonic()
+                failed = {pk: until for pk, until in failed.items() if until > now}
+                image_ids = pending_image_ids(limit=workers * 4, exclude=failed)
+                futures = {pk: pool.submit(render_image, pk) for pk in image_ids}
+                for pk, future in futures.items():
+                    try:
+                        log.info("renditions ready image_id=%s count=%s", pk, future.result())
+                    except Exception:
+                        failed[pk] = time.monotonic() + RETRY_AFTER_SECONDS
+                        log.exception("renditions failed image_id=%s", pk)
+                if not image_ids:
+                    time.sleep(interval)
+            except SystemExit:
+                break
+            except Exception as e:
+                log.exception(e)
+                time.sleep(30)
+
+
+if __name__ == "__main__":
+    main()
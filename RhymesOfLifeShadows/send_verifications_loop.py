@@ -18,22 +18,32 @@ def shutdown_handler(signum, frame):
 def process_verifications():
     sender = EmailVerificationSender(provider="postbox_api", logger=log)
 
-    verifications = AdditionalUserInfo.objects.filter(
+    verifications = AdditionalUserInfo.objects.select_related("user").filter(
         ready_for_verification=True,
         is_verified=False,
     )
 
+    infos, payloads = [], []
     for info in verifications:
-        email = info.email or info.user.email
         try:
-            sender.send_verification(info)
-            info.ready_for_verification = False
-            info.save(update_fields=["ready_for_verification"])
-            log.info("verification.sent email=%s", email)
+            payloads.append(sender.verification_payload(info))
+            infos.append(info)
         except Exception as e:
-            log.error("verification.failed email=%s error=%s", email, str(e))
+            log.error("verification.failed email=%s error=%s", info.email or info.user.email, str(e))
             log.exception(e)
 
+    sent_ids = []
+    for info, ok in zip(infos, sender.send_emails(payloads)):
+        email = info.email or info.user.email
+        if ok:
+            sent_ids.append(info.pk)
+            log.info("verification.sent email=%s", email)
+        else:
+            log.error("verification.failed email=%s", email)
+
+    if sent_ids:
+        AdditionalUserInfo.objects.filter(pk__in=sent_ids).update(ready_for_verification=False)
+
 
 if __name__ == "__main__":
     signal.signal(signal.SIGINT, shutdown_handler)
@@ -0,0 +1,37 @@
+import time
+import signal
+
+from orm_connector import settings  # noqa: F401
+
+from django.conf import settings as dj_settings
+
+from RhymesOfLifeShadows.create_log import create_log
+from base.utils.timeline import run_pending_fan_outs
+
+log = create_log("timeline_fanout.log", "TimelineFanOut")
+
+POLL_INTERVAL = int(getattr(dj_settings, "TIMELINE_POLL_INTERVAL_SECONDS", 2))
+
+
+def shutdown_handler(signum, frame):
+    log.info("shutdown")
+    raise SystemExit
+
+
+def main():
+    signal.signal(signal.SIGINT, shutdown_handler)
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    log.info("start timeline fan-out")
+    while True:
+        try:
+            if not run_pending_fan_outs(logger=log):
+                time.sleep(POLL_INTERVAL)
+        except SystemExit:
+            break
+        except Exception as e:
+            log.exception(e)
+            time.sleep(30)
+
+
+if __name__ == "__main__":
+    main()
@@ -214,14 +214,14 @@ def loop_once() -> int:
                 email_subject=title if via_email else None,
                 email_body=build_email_body(info, msg) if via_email else None,
                 email_html=build_email_html(info, title, msg) if via_email else None,
+                dedupe_key=f"wellness:{info.pk}:{today.isoformat()}",
             )
 
-        success = any([bool(res.get("telegram_sent")), bool(res.get("email_sent")), True])
-        if success:
+        if res.get("telegram_queued") or res.get("email_queued"):
             sent += 1
-            log.info(f"sent to user_info={info.pk}")
+            log.info(f"queued for user_info={info.pk}")
         else:
-            log.warning(f"delivery failed user_info={info.pk}")
+            log.warning(f"nothing to deliver user_info={info.pk}")
 
     return sent
 